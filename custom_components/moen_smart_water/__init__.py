@@ -3,17 +3,18 @@
 from __future__ import annotations
 
 import logging
-import time
 from typing import Any
 
 __version__ = "0.9.4"
 
+import aiohttp
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import Platform
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
 
 from .api import MoenAPI
-from .coordinator import MoenDataUpdateCoordinator
+from .coordinator import MoenDataUpdateCoordinator, async_store_tokens
 from .services import async_setup_services
 
 _LOGGER = logging.getLogger(__name__)
@@ -27,42 +28,39 @@ PLATFORMS: list[Platform] = [
 ]
 
 
-async def _store_tokens(
-    hass: HomeAssistant, entry: ConfigEntry, tokens: dict[str, Any]
-) -> None:
-    """Store tokens in the config entry."""
-    # Update the config entry with new tokens
-    new_data = {**entry.data, "tokens": tokens}
-    hass.config_entries.async_update_entry(entry, data=new_data)
+async def _async_log_user_profile(api: MoenAPI) -> None:
+    """Fetch the user profile and log who we are connected as."""
+    try:
+        user_profile = await api.get_user_profile()
+    except (aiohttp.ClientError, TimeoutError, ValueError) as err:
+        # Nothing awaits this task, so no failure may escape it
+        _LOGGER.debug("Could not fetch user profile: %s", err)
+        return
+    _LOGGER.info(
+        "Successfully connected to Moen API for user: %s",
+        user_profile.get("email", "unknown"),
+    )
 
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up Moen Smart Water from a config entry."""
-    hass.data.setdefault("moen_smart_water", {})
-
     # Get stored tokens from config entry
     stored_tokens = entry.data.get("tokens")
 
     # Initialize the API client with stored tokens
     api = MoenAPI(
+        session=async_get_clientsession(hass),
         username=entry.data["username"],
         password=entry.data["password"],
         tokens=stored_tokens,
     )
 
-    # Test the connection and get user profile
+    # Only login if we don't have valid tokens
     try:
-        # Only login if we don't have valid tokens
-        if not api.access_token or time.time() > api.token_expiry:
-            await hass.async_add_executor_job(api.login)
+        if not api.has_valid_token():
+            await api.login()
             # Store the new tokens
-            await _store_tokens(hass, entry, api.get_tokens())
-
-        user_profile = await hass.async_add_executor_job(api.get_user_profile)
-        _LOGGER.info(
-            "Successfully connected to Moen API for user: %s",
-            user_profile.get("email", "unknown"),
-        )
+            await async_store_tokens(hass, entry, api.get_tokens())
     except Exception as err:
         _LOGGER.error("Failed to connect to Moen API: %s", err)
         return False
@@ -73,8 +71,8 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     # Fetch initial data
     await coordinator.async_config_entry_first_refresh()
 
-    # Store the coordinator in hass data
-    hass.data["moen_smart_water"][entry.entry_id] = coordinator
+    # Store the coordinator on the config entry
+    entry.runtime_data = coordinator
 
     # Forward the setup to the platforms
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
@@ -82,14 +80,16 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     # Set up services
     await async_setup_services(hass)
 
+    # The profile is only needed for logging; keep it off the startup path
+    entry.async_create_background_task(
+        hass, _async_log_user_profile(api), "moen_smart_water user profile"
+    )
+
     return True
 
 
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
-    unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
-
-    if unload_ok:
-        hass.data["moen_smart_water"].pop(entry.entry_id)
-
+    if unload_ok := await hass.config_entries.async_unload_platforms(entry, PLATFORMS):
+        entry.runtime_data.api.close()
     return unload_ok
@@ -2,15 +2,23 @@
 
 from __future__ import annotations
 
-import json
+import asyncio
+import inspect
 import logging
+import random
 import time
-from typing import Any
+from collections.abc import Awaitable, Callable
+from functools import partial, wraps
+from typing import Any, Concatenate, ParamSpec, TypeVar
 
-import requests
+import aiohttp
+import orjson
 
 _LOGGER = logging.getLogger(__name__)
 
+_P = ParamSpec("_P")
+_R = TypeVar("_R")
+
 # API endpoints from the documentation
 OAUTH_BASE = "https://4j1gkf0vji.execute-api.us-east-2.amazonaws.com/prod/v1"
 API_BASE = "https://api.prod.iot.moen.com/v3"
@@ -22,29 +30,151 @@ CLIENT_ID = "6qn9pep31dglq6ed4fvlq6rp5t"
 # User agent from the documentation
 USER_AGENT = "Smartwater-iOS-prod-3.39.0"
 
+# Headers sent with token requests; shared, never mutated
+OAUTH_HEADERS: dict[str, str] = {
+    "Accept": "*/*",
+    "Content-Type": "application/x-www-form-urlencoded",
+    "Accept-Language": "en-US,en;q=0.9",
+    "Accept-Encoding": "gzip, deflate, br",
+    "User-Agent": USER_AGENT,
+    "priority": "u=3",
+}
+
+# Total timeout applied to every API request
+REQUEST_TIMEOUT = aiohttp.ClientTimeout(total=30)
+
+# How long the device list is served before it is refreshed in the background
+DEVICE_LIST_TTL = 3600
+
+# Retry policy for transient failures (throttling, gateway errors, timeouts)
+RETRY_ATTEMPTS = 3
+RETRY_BASE_DELAY = 1.0
+RETRY_MAX_DELAY = 30.0
+RETRY_JITTER = 0.5
+RETRYABLE_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+# Shadow update payload for stopping water flow; shared, never mutated
+STOP_PAYLOAD: dict[str, Any] = {"commandSrc": "app", "command": "stop"}
+
+# Upper bound on requests a single client has on the wire at once
+MAX_CONCURRENT_REQUESTS = 4
+
+# How long a fetched device shadow is reused before hitting the API again
+SHADOW_CACHE_TTL = 1.5
+
+
+class MoenResponseError(aiohttp.ClientError):
+    """The API answered with an empty or malformed body."""
+
+
+async def _read_json(response: aiohttp.ClientResponse) -> dict[str, Any]:
+    """Decode a JSON object response body."""
+    try:
+        data = await response.json(content_type=None, loads=orjson.loads)
+    except orjson.JSONDecodeError as err:
+        raise MoenResponseError(f"Malformed response body: {err}") from err
+    # An empty body decodes to None
+    if not isinstance(data, dict):
+        raise MoenResponseError(f"Expected a JSON object, got {type(data).__name__}")
+    return data
+
+
+def _invoker_payload(data: dict[str, Any]) -> dict[str, Any]:
+    """Decode the JSON-encoded Payload of an invoker response."""
+    try:
+        payload = orjson.loads(data["Payload"])
+    except (KeyError, TypeError, orjson.JSONDecodeError) as err:
+        raise MoenResponseError(f"Malformed invoker payload: {err!r}") from err
+    if not isinstance(payload, dict):
+        raise MoenResponseError(
+            f"Expected a JSON object payload, got {type(payload).__name__}"
+        )
+    return payload
+
+
+def _api_call(
+    action: str,
+    *,
+    log_failures: bool = True,
+) -> Callable[
+    [Callable[Concatenate[MoenAPI, _P], Awaitable[_R]]],
+    Callable[Concatenate[MoenAPI, _P], Awaitable[_R]],
+]:
+    """Wrap an authenticated API call with the shared auth and error handling.
+
+    The token is ensured before the call. If the API still rejects it (401),
+    the token is discarded and the call is retried once with a fresh one.
+    Failures are logged as "Failed to <action>", where action may reference
+    the wrapped method's arguments by name, e.g. "get shadow for {client_id}".
+    Pass log_failures=False when the caller reports failures itself.
+    """
+
+    def decorator(
+        method: Callable[Concatenate[MoenAPI, _P], Awaitable[_R]],
+    ) -> Callable[Concatenate[MoenAPI, _P], Awaitable[_R]]:
+        signature = inspect.signature(method)
+
+        @wraps(method)
+        async def wrapper(self: MoenAPI, *args: _P.args, **kwargs: _P.kwargs) -> _R:
+            await self._ensure_auth()
+            token = self.access_token
+            try:
+                try:
+                    return await method(self, *args, **kwargs)
+                except aiohttp.ClientResponseError as err:
+                    if err.status != 401:
+                        raise
+                    _LOGGER.info("Access token rejected, re-authenticating")
+                    self._discard_token(token)
+                    await self._ensure_auth()
+                    return await method(self, *args, **kwargs)
+            except (aiohttp.ClientError, TimeoutError) as err:
+                if log_failures:
+                    arguments = signature.bind(self, *args, **kwargs).arguments
+                    _LOGGER.error("Failed to %s: %s", action.format(**arguments), err)
+                raise
+
+        return wrapper
+
+    return decorator
+
 
 class MoenAPI:
     """Comprehensive API client for Moen Smart Water operations."""
 
     def __init__(
-        self, username: str, password: str, tokens: dict[str, Any] | None = None
+        self,
+        session: aiohttp.ClientSession,
+        username: str,
+        password: str,
+        tokens: dict[str, Any] | None = None,
+        max_concurrency: int = MAX_CONCURRENT_REQUESTS,
     ) -> None:
-        """Initialize the Moen API client."""
+        """Initialize the Moen API client.
+
+        The session is owned by the caller (normally Home Assistant's shared
+        client session) and is never closed by the client. At most
+        max_concurrency requests are sent at once so that bursts (such as a
+        multi-device poll) do not trip the API gateway's rate limiting.
+        """
         self.client_id = CLIENT_ID
         self.username = username
         self.password = password
-        self.session = requests.Session()
-        self.session.headers.update(
-            {
-                "User-Agent": USER_AGENT,
-            }
-        )
+        self.session = session
+        self._request_slots = asyncio.Semaphore(max_concurrency)
+        self.headers: dict[str, str] = {
+            "User-Agent": USER_AGENT,
+        }
 
         # Authentication state
+        self._auth_lock = asyncio.Lock()
         self.access_token: str | None = None
         self.id_token: str | None = None
         self.refresh_token: str | None = None
+        # Wall-clock expiry is persisted with the tokens; the monotonic copy
+        # is what the client compares against so clock steps cannot skew it
         self.token_expiry = 0.0
+        self._expiry_monotonic = 0.0
 
         # Restore tokens if provided
         if tokens:
@@ -52,28 +182,67 @@ class MoenAPI:
             self.id_token = tokens.get("id_token")
             self.refresh_token = tokens.get("refresh_token")
             self.token_expiry = tokens.get("token_expiry", 0.0)
+            self._expiry_monotonic = time.monotonic() + (
+                self.token_expiry - time.time()
+            )
 
-            # Update session headers if we have a valid token
-            if self.access_token and time.time() < self.token_expiry:
-                self.session.headers.update(
-                    {"Authorization": f"Bearer {self.access_token}"}
-                )
+            # Update request headers if we have a valid token
+            if self.has_valid_token():
+                self.headers.update({"Authorization": f"Bearer {self.access_token}"})
 
         # Cached data
         self._user_profile: dict[str, Any] | None = None
         self._locations: list[dict[str, Any]] | None = None
         self._devices: list[dict[str, Any]] | None = None
+        self._devices_fetched_at = 0.0
+        self._devices_refresh: asyncio.Task[None] | None = None
         self._temperature_definitions: dict[str, Any] | None = None
+        # client_id -> (monotonic fetch time, shadow)
+        self._shadow_cache: dict[str, tuple[float, dict[str, Any]]] = {}
+        # client_id -> shadow request currently on the wire
+        self._shadow_requests: dict[str, asyncio.Task[dict[str, Any]]] = {}
+
+    def has_valid_token(self) -> bool:
+        """Return True if the current access token has not expired."""
+        return bool(self.access_token) and time.monotonic() <= self._expiry_monotonic
+
+    def _set_token_expiry(self, expires_in: float) -> None:
+        """Record when a freshly issued access token expires."""
+        # Expire 60 seconds early so requests never race the real expiry
+        remaining = expires_in - 60
+        self.token_expiry = time.time() + remaining
+        self._expiry_monotonic = time.monotonic() + remaining
+
+    def _discard_token(self, token: str | None) -> None:
+        """Treat an access token the API rejected as expired.
+
+        Only the token a caller actually sent is discarded, so concurrent
+        rejections do not throw away a token another caller just obtained.
+        """
+        if token == self.access_token:
+            self._expiry_monotonic = 0.0
+            self.token_expiry = 0.0
 
-    def _ensure_auth(self) -> None:
+    async def _ensure_auth(self) -> None:
         """Ensure we have a valid authentication token."""
-        if not self.access_token or time.time() > self.token_expiry:
+        if self.has_valid_token():
+            return
+
+        async with self._auth_lock:
+            # Another caller may have re-authenticated while we waited
+            if self.has_valid_token():
+                return
+
             _LOGGER.info("Token expired or missing, attempting refresh")
-            if self.refresh_token and not self._refresh_access_token():
-                _LOGGER.info("Refresh failed, re-authenticating with username/password")
-                self.login()
+            # Without a refresh token this returns False straight away
+            if not await self._refresh_access_token():
+                _LOGGER.info(
+                    "Refresh unavailable or failed, re-authenticating with "
+                    "username/password"
+                )
+                await self.login()
 
-    def _refresh_access_token(self) -> bool:
+    async def _refresh_access_token(self) -> bool:
         """Refresh the access token using the refresh token."""
         if not self.refresh_token:
             return False
@@ -89,31 +258,25 @@ class MoenAPI:
             "client_id": self.client_id,
         }
 
-        headers = {
-            "Accept": "*/*",
-            "Content-Type": "application/x-www-form-urlencoded",
-            "Accept-Language": "en-US,en;q=0.9",
-            "Accept-Encoding": "gzip, deflate, br",
-            "User-Agent": USER_AGENT,
-            "priority": "u=3",
-        }
-
         try:
-            import json
-
-            json_string = json.dumps(refresh_payload)
+            json_body = orjson.dumps(refresh_payload)
 
             _LOGGER.debug("Refresh URL: %s", refresh_url)
             _LOGGER.debug("Refresh payload: %s", refresh_payload)
 
-            response = self.session.post(
-                refresh_url, data=json_string, headers=headers, timeout=30
-            )
-
-            _LOGGER.debug("Refresh response status: %s", response.status_code)
-            response.raise_for_status()
+            async with (
+                self._request_slots,
+                self.session.post(
+                    refresh_url,
+                    data=json_body,
+                    headers=OAUTH_HEADERS,
+                    timeout=REQUEST_TIMEOUT,
+                ) as response,
+            ):
+                _LOGGER.debug("Refresh response status: %s", response.status)
+                response.raise_for_status()
 
-            data = response.json()
+                data = await _read_json(response)
 
             if "token" in data:
                 token_data = data["token"]
@@ -121,14 +284,10 @@ class MoenAPI:
                 self.id_token = token_data.get("id_token")
                 self.refresh_token = token_data.get("refresh_token", self.refresh_token)
 
-                # Set expiry with 60 second buffer
-                expires_in = token_data.get("expires_in", 3600)
-                self.token_expiry = time.time() + expires_in - 60
+                self._set_token_expiry(token_data.get("expires_in", 3600))
 
-                # Update session headers
-                self.session.headers.update(
-                    {"Authorization": f"Bearer {self.access_token}"}
-                )
+                # Update request headers
+                self.headers.update({"Authorization": f"Bearer {self.access_token}"})
 
                 _LOGGER.info("Successfully refreshed access token")
                 return True
@@ -140,7 +299,7 @@ class MoenAPI:
             _LOGGER.error("Token refresh failed: %s", err)
             return False
 
-    def login(self) -> dict[str, Any]:
+    async def login(self) -> dict[str, Any]:
         """Login to the Moen API and get access token."""
         _LOGGER.info("Starting login process for user: %s", self.username)
 
@@ -153,35 +312,29 @@ class MoenAPI:
             "password": self.password,
         }
 
-        headers = {
-            "Accept": "*/*",
-            "Content-Type": "application/x-www-form-urlencoded",
-            "Accept-Language": "en-US,en;q=0.9",
-            "Accept-Encoding": "gzip, deflate, br",
-            "User-Agent": USER_AGENT,
-            "priority": "u=3",
-        }
-
         try:
             # Send JSON directly as request body (as shown in the API documentation)
-            import json
-
-            json_string = json.dumps(json_payload)
+            json_body = orjson.dumps(json_payload)
 
             _LOGGER.debug("Login URL: %s", login_url)
-            _LOGGER.debug("Headers: %s", headers)
+            _LOGGER.debug("Headers: %s", OAUTH_HEADERS)
             _LOGGER.debug("JSON payload: %s", json_payload)
-            _LOGGER.debug("JSON string: %s", json_string)
-
-            response = self.session.post(
-                login_url, data=json_string, headers=headers, timeout=30
-            )
-
-            _LOGGER.debug("Response status: %s", response.status_code)
-            _LOGGER.debug("Response headers: %s", dict(response.headers))
-            response.raise_for_status()
 
-            data = response.json()
+            async with (
+                self._request_slots,
+                self.session.post(
+                    login_url,
+                    data=json_body,
+                    headers=OAUTH_HEADERS,
+                    timeout=REQUEST_TIMEOUT,
+                ) as response,
+            ):
+                _LOGGER.debug("Response status: %s", response.status)
+                if _LOGGER.isEnabledFor(logging.DEBUG):
+                    _LOGGER.debug("Response headers: %s", dict(response.headers))
+                response.raise_for_status()
+
+                data = await _read_json(response)
 
             if "token" in data:
                 token_data = data["token"]
@@ -189,71 +342,110 @@ class MoenAPI:
                 self.id_token = token_data.get("id_token")
                 self.refresh_token = token_data.get("refresh_token")
 
-                # Set expiry with 60 second buffer
-                expires_in = token_data.get("expires_in", 3600)
-                self.token_expiry = time.time() + expires_in - 60
+                self._set_token_expiry(token_data.get("expires_in", 3600))
 
-                # Update session headers
-                self.session.headers.update(
-                    {"Authorization": f"Bearer {self.access_token}"}
-                )
+                # Update request headers
+                self.headers.update({"Authorization": f"Bearer {self.access_token}"})
 
                 _LOGGER.info("Successfully authenticated with Moen API")
                 return data
             else:
                 _LOGGER.error("No token in response: %s", data)
-                raise requests.exceptions.RequestException("No token in response")
+                raise aiohttp.ClientError("No token in response")
 
-        except requests.exceptions.RequestException as err:
+        except (aiohttp.ClientError, TimeoutError) as err:
             _LOGGER.error("Login failed: %s", err)
             raise
 
-    def get_user_profile(self) -> dict[str, Any]:
-        """Get user profile information."""
-        self._ensure_auth()
+    async def _post_with_retry(
+        self, url: str, payload: dict[str, Any], *, idempotent: bool = True
+    ) -> Any:
+        """POST a JSON payload, retrying transient failures with backoff.
+
+        Throttling (429), gateway errors (5xx), connection errors and timeouts
+        are retried with exponential backoff and jitter; anything else is
+        raised immediately. Requests that are not idempotent, such as device
+        commands, may already have been applied after a timeout, 5xx or lost
+        connection, so they are only retried on 429 or when the connection
+        could not be opened.
+        """
+        attempt = 0
+        while True:
+            try:
+                async with (
+                    self._request_slots,
+                    self.session.post(
+                        url, json=payload, headers=self.headers, timeout=REQUEST_TIMEOUT
+                    ) as response,
+                ):
+                    response.raise_for_status()
+                    return await _read_json(response)
+            except (
+                aiohttp.ClientResponseError,
+                aiohttp.ClientConnectionError,
+                TimeoutError,
+            ) as err:
+                attempt += 1
+                if isinstance(err, aiohttp.ClientResponseError):
+                    retryable = (
+                        err.status in RETRYABLE_STATUSES
+                        if idempotent
+                        else err.status == 429
+                    )
+                else:
+                    retryable = idempotent or isinstance(
+                        err, aiohttp.ClientConnectorError
+                    )
+                if attempt >= RETRY_ATTEMPTS or not retryable:
+                    raise
+                delay = min(RETRY_MAX_DELAY, RETRY_BASE_DELAY * 2 ** (attempt - 1))
+                delay *= 1 + random.random() * RETRY_JITTER
+                _LOGGER.debug(
+                    "Request to %s failed (%s), retrying in %.1fs", url, err, delay
+                )
+            await asyncio.sleep(delay)
 
+    @_api_call("get user profile")
+    async def get_user_profile(self) -> dict[str, Any]:
+        """Get user profile information."""
         url = f"{OAUTH_BASE}/users/me"
 
-        try:
-            response = self.session.get(url, timeout=30)
+        async with (
+            self._request_slots,
+            self.session.get(
+                url, headers=self.headers, timeout=REQUEST_TIMEOUT
+            ) as response,
+        ):
             response.raise_for_status()
+            profile = await _read_json(response)
 
-            profile = response.json()
-            self._user_profile = profile
-            _LOGGER.info(
-                "Retrieved user profile for %s", profile.get("email", "unknown")
-            )
-            return profile
-
-        except requests.exceptions.RequestException as err:
-            _LOGGER.error("Failed to get user profile: %s", err)
-            raise
+        self._user_profile = profile
+        _LOGGER.info("Retrieved user profile for %s", profile.get("email", "unknown"))
+        return profile
 
-    def get_locations(self) -> list[dict[str, Any]]:
+    @_api_call("get locations")
+    async def get_locations(self) -> list[dict[str, Any]]:
         """Get list of locations."""
-        self._ensure_auth()
-
         url = f"{API_BASE}/locations"
         params = {"limit": 100}
 
-        try:
-            response = self.session.get(url, params=params, timeout=30)
+        async with (
+            self._request_slots,
+            self.session.get(
+                url, params=params, headers=self.headers, timeout=REQUEST_TIMEOUT
+            ) as response,
+        ):
             response.raise_for_status()
+            data = await _read_json(response)
 
-            data = response.json()
-            locations = data.get("locations", [])
-            self._locations = locations
-            _LOGGER.info("Retrieved %d locations", len(locations))
-            return locations
+        locations = data.get("locations", [])
+        self._locations = locations
+        _LOGGER.info("Retrieved %d locations", len(locations))
+        return locations
 
-        except requests.exceptions.RequestException as err:
-            _LOGGER.error("Failed to get locations: %s", err)
-            raise
-
-    def get_user_details_and_temperature_definitions(self) -> dict[str, Any]:
+    @_api_call("get user details")
+    async def get_user_details_and_temperature_definitions(self) -> dict[str, Any]:
         """Get user details and temperature definitions."""
-        self._ensure_auth()
-
         url = f"{INVOKER_BASE}/invoker"
         payload = {
             "body": {"locale": "en_US"},
@@ -262,29 +454,28 @@ class MoenAPI:
             "parse": False,
         }
 
-        try:
-            response = self.session.post(url, json=payload, timeout=30)
+        async with (
+            self._request_slots,
+            self.session.post(
+                url, json=payload, headers=self.headers, timeout=REQUEST_TIMEOUT
+            ) as response,
+        ):
             response.raise_for_status()
-
-            data = response.json()
-            if data.get("StatusCode") == 200:
-                payload_data = json.loads(data["Payload"])
-                body = payload_data.get("body", {})
-                self._temperature_definitions = body.get("temperatureDefinitions", {})
-                _LOGGER.info("Retrieved user details and temperature definitions")
-                return body
-            else:
-                _LOGGER.error("Failed to get user details: %s", data)
-                raise requests.exceptions.RequestException("Failed to get user details")
-
-        except requests.exceptions.RequestException as err:
-            _LOGGER.error("Failed to get user details: %s", err)
-            raise
-
-    def list_devices(self) -> list[dict[str, Any]]:
+            data = await _read_json(response)
+
+        if data.get("StatusCode") == 200:
+            payload_data = _invoker_payload(data)
+            body = payload_data.get("body", {})
+            self._temperature_definitions = body.get("temperatureDefinitions", {})
+            _LOGGER.info("Retrieved user details and temperature definitions")
+            return body
+        else:
+            _LOGGER.error("Failed to get user details: %s", data)
+            raise aiohttp.ClientError("Failed to get user details")
+
+    @_api_call("list devices")
+    async def list_devices(self) -> list[dict[str, Any]]:
         """List all devices (filtering for VAK devices only)."""
-        self._ensure_auth()
-
         url = f"{INVOKER_BASE}/invoker"
         payload = {
             "parse": False,
@@ -293,40 +484,38 @@ class MoenAPI:
             "escape": False,
         }
 
-        try:
-            response = self.session.post(url, json=payload, timeout=30)
+        async with (
+            self._request_slots,
+            self.session.post(
+                url, json=payload, headers=self.headers, timeout=REQUEST_TIMEOUT
+            ) as response,
+        ):
             response.raise_for_status()
+            data = await _read_json(response)
+
+        if data.get("StatusCode") == 200:
+            payload_data = _invoker_payload(data)
+            all_devices = payload_data.get("body", [])
+
+            # Filter for VAK devices only (ignore FLO devices)
+            vak_devices = [
+                device for device in all_devices if device.get("deviceType") == "VAK"
+            ]
+            self._devices = vak_devices
+            self._devices_fetched_at = time.monotonic()
+            _LOGGER.info(
+                "Retrieved %d VAK devices (filtered from %d total devices)",
+                len(vak_devices),
+                len(all_devices),
+            )
+            return vak_devices
+        else:
+            _LOGGER.error("Failed to list devices: %s", data)
+            raise aiohttp.ClientError("Failed to list devices")
 
-            data = response.json()
-            if data.get("StatusCode") == 200:
-                payload_data = json.loads(data["Payload"])
-                all_devices = payload_data.get("body", [])
-
-                # Filter for VAK devices only (ignore FLO devices)
-                vak_devices = [
-                    device
-                    for device in all_devices
-                    if device.get("deviceType") == "VAK"
-                ]
-                self._devices = vak_devices
-                _LOGGER.info(
-                    "Retrieved %d VAK devices (filtered from %d total devices)",
-                    len(vak_devices),
-                    len(all_devices),
-                )
-                return vak_devices
-            else:
-                _LOGGER.error("Failed to list devices: %s", data)
-                raise requests.exceptions.RequestException("Failed to list devices")
-
-        except requests.exceptions.RequestException as err:
-            _LOGGER.error("Failed to list devices: %s", err)
-            raise
-
-    def list_presets(self) -> list[dict[str, Any]]:
+    @_api_call("list presets")
+    async def list_presets(self) -> list[dict[str, Any]]:
         """List presets for the device."""
-        self._ensure_auth()
-
         url = f"{INVOKER_BASE}/invoker"
         payload = {
             "body": {"locale": "en_US"},
@@ -335,25 +524,26 @@ class MoenAPI:
             "parse": False,
         }
 
-        try:
-            response = self.session.post(url, json=payload, timeout=30)
+        async with (
+            self._request_slots,
+            self.session.post(
+                url, json=payload, headers=self.headers, timeout=REQUEST_TIMEOUT
+            ) as response,
+        ):
             response.raise_for_status()
-
-            data = response.json()
-            if data.get("StatusCode") == 200:
-                payload_data = json.loads(data["Payload"])
-                presets = payload_data.get("body", [])
-                _LOGGER.info("Retrieved %d presets", len(presets))
-                return presets
-            else:
-                _LOGGER.error("Failed to list presets: %s", data)
-                raise requests.exceptions.RequestException("Failed to list presets")
-
-        except requests.exceptions.RequestException as err:
-            _LOGGER.error("Failed to list presets: %s", err)
-            raise
-
-    def get_device_details(
+            data = await _read_json(response)
+
+        if data.get("StatusCode") == 200:
+            payload_data = _invoker_payload(data)
+            presets = payload_data.get("body", [])
+            _LOGGER.info("Retrieved %d presets", len(presets))
+            return presets
+        else:
+            _LOGGER.error("Failed to list presets: %s", data)
+            raise aiohttp.ClientError("Failed to list presets")
+
+    @_api_call("get device details for {device_id}")
+    async def get_device_details(
         self, device_id: str, units: str = "imperial"
     ) -> dict[str, Any]:
         """Get detailed device information with all available attributes.
@@ -362,46 +552,97 @@ class MoenAPI:
             device_id: The device ID to get details for
             units: Units for measurements ("imperial" or "metric")
         """
-        self._ensure_auth()
-
         url = f"{API_BASE}/device/{device_id}"
         params = {"expand": "addons", "units": units}
 
-        try:
-            response = self.session.get(url, params=params, timeout=30)
+        async with (
+            self._request_slots,
+            self.session.get(
+                url, params=params, headers=self.headers, timeout=REQUEST_TIMEOUT
+            ) as response,
+        ):
             response.raise_for_status()
+            device_data = await _read_json(response)
 
-            device_data = response.json()
-            _LOGGER.info("Retrieved device details for %s", device_id)
-            return device_data
+        _LOGGER.info("Retrieved device details for %s", device_id)
+        return device_data
 
-        except requests.exceptions.RequestException as err:
-            _LOGGER.error("Failed to get device details for %s: %s", device_id, err)
-            raise
-
-    def get_winterize_status(self, location_id: str) -> dict[str, Any]:
+    @_api_call("get winterize status for {location_id}")
+    async def get_winterize_status(self, location_id: str) -> dict[str, Any]:
         """Get winterize status for a location."""
-        self._ensure_auth()
-
         url = f"{API_BASE}/actions/routine/winterize"
         params = {"location": location_id}
 
-        try:
-            response = self.session.get(url, params=params, timeout=30)
+        async with (
+            self._request_slots,
+            self.session.get(
+                url, params=params, headers=self.headers, timeout=REQUEST_TIMEOUT
+            ) as response,
+        ):
             response.raise_for_status()
+            winterize_data = await _read_json(response)
 
-            winterize_data = response.json()
-            _LOGGER.info("Retrieved winterize status for location %s", location_id)
-            return winterize_data
+        _LOGGER.info("Retrieved winterize status for location %s", location_id)
+        return winterize_data
 
-        except requests.exceptions.RequestException as err:
-            _LOGGER.error("Failed to get winterize status for %s: %s", location_id, err)
-            raise
-
-    def get_device_shadow(self, client_id: str) -> dict[str, Any]:
+    async def get_device_shadow(self, client_id: str) -> dict[str, Any]:
         """Get device shadow (current state and configuration)."""
-        self._ensure_auth()
+        cached = self._shadow_cache.get(client_id)
+        if cached and time.monotonic() - cached[0] < SHADOW_CACHE_TTL:
+            return cached[1]
+
+        # Concurrent callers share the request already in flight
+        task = self._shadow_requests.get(client_id)
+        if task is None:
+            task = asyncio.get_running_loop().create_task(
+                self._fetch_device_shadow(client_id)
+            )
+            self._shadow_requests[client_id] = task
+            task.add_done_callback(partial(self._shadow_request_done, client_id))
+
+        # Shield so one cancelled caller does not cancel the shared request
+        return await asyncio.shield(task)
 
+    async def get_device_shadows(
+        self, client_ids: list[str]
+    ) -> dict[str, dict[str, Any]]:
+        """Get device shadows for several devices at once.
+
+        The API has no bulk shadow endpoint, so the per-device requests are
+        issued concurrently. Devices whose shadow could not be fetched are
+        logged and left out of the result.
+        """
+        results = await asyncio.gather(
+            *(self.get_device_shadow(client_id) for client_id in client_ids),
+            return_exceptions=True,
+        )
+
+        shadows: dict[str, dict[str, Any]] = {}
+        for client_id, result in zip(client_ids, results, strict=True):
+            if isinstance(result, BaseException):
+                _LOGGER.warning(
+                    "Failed to get shadow for device %s: %s", client_id, result
+                )
+                continue
+            shadows[client_id] = result
+        return shadows
+
+    def _shadow_request_done(
+        self, client_id: str, task: asyncio.Task[dict[str, Any]]
+    ) -> None:
+        """Cache the result of a finished shadow request."""
+        failed = task.cancelled() or task.exception() is not None
+        if self._shadow_requests.get(client_id) is not task:
+            # Invalidated while in flight, the result may already be stale
+            return
+        del self._shadow_requests[client_id]
+        if not failed:
+            self._shadow_cache[client_id] = (time.monotonic(), task.result())
+
+    # Failures are logged per device by get_device_shadows
+    @_api_call("get device shadow for {client_id}", log_failures=False)
+    async def _fetch_device_shadow(self, client_id: str) -> dict[str, Any]:
+        """Fetch the device shadow from the API."""
         url = f"{INVOKER_BASE}/invoker"
         payload = {
             "parse": False,
@@ -410,32 +651,24 @@ class MoenAPI:
             "body": {"clientId": client_id, "shadow": True, "locale": "en_US"},
         }
 
-        try:
-            response = self.session.post(url, json=payload, timeout=30)
-            response.raise_for_status()
-
-            data = response.json()
-            if data.get("StatusCode") == 200:
-                payload_data = json.loads(data["Payload"])
-                shadow_data = payload_data.get("body", {})
-                _LOGGER.info("Retrieved device shadow for %s", client_id)
-                return shadow_data
-            else:
-                _LOGGER.error("Failed to get device shadow: %s", data)
-                raise requests.exceptions.RequestException(
-                    "Failed to get device shadow"
-                )
-
-        except requests.exceptions.RequestException as err:
-            _LOGGER.error("Failed to get device shadow for %s: %s", client_id, err)
-            raise
+        data = await self._post_with_retry(url, payload)
+
+        if data.get("StatusCode") == 200:
+            payload_data = _invoker_payload(data)
+            shadow_data = payload_data.get("body", {})
+            _LOGGER.info("Retrieved device shadow for %s", client_id)
+            return shadow_data
+        else:
+            _LOGGER.debug("Device shadow response for %s: %s", client_id, data)
+            raise aiohttp.ClientError(
+                f"Shadow request returned status {data.get('StatusCode')}"
+            )
 
-    def get_daily_usage(
+    @_api_call("get daily usage for {client_id}")
+    async def get_daily_usage(
         self, client_id: str, timezone_offset: int = -7, query_date: int | None = None
     ) -> dict[str, Any]:
         """Get daily usage statistics."""
-        self._ensure_auth()
-
         if query_date is None:
             query_date = int(time.time())
 
@@ -454,28 +687,27 @@ class MoenAPI:
             "escape": False,
         }
 
-        try:
-            response = self.session.post(url, json=payload, timeout=30)
+        async with (
+            self._request_slots,
+            self.session.post(
+                url, json=payload, headers=self.headers, timeout=REQUEST_TIMEOUT
+            ) as response,
+        ):
             response.raise_for_status()
-
-            data = response.json()
-            if data.get("StatusCode") == 200:
-                payload_data = json.loads(data["Payload"])
-                usage_data = payload_data.get("body", {})
-                _LOGGER.info("Retrieved daily usage for %s", client_id)
-                return usage_data
-            else:
-                _LOGGER.error("Failed to get daily usage: %s", data)
-                raise requests.exceptions.RequestException("Failed to get daily usage")
-
-        except requests.exceptions.RequestException as err:
-            _LOGGER.error("Failed to get daily usage for %s: %s", client_id, err)
-            raise
-
-    def get_session_data(self, client_id: str, limit: int = 5) -> dict[str, Any]:
+            data = await _read_json(response)
+
+        if data.get("StatusCode") == 200:
+            payload_data = _invoker_payload(data)
+            usage_data = payload_data.get("body", {})
+            _LOGGER.info("Retrieved daily usage for %s", client_id)
+            return usage_data
+        else:
+            _LOGGER.error("Failed to get daily usage: %s", data)
+            raise aiohttp.ClientError("Failed to get daily usage")
+
+    @_api_call("get session data for {client_id}")
+    async def get_session_data(self, client_id: str, limit: int = 5) -> dict[str, Any]:
         """Get session data for a device."""
-        self._ensure_auth()
-
         url = f"{INVOKER_BASE}/invoker"
         payload = {
             "body": {"limit": limit, "locale": "en_US", "clientId": client_id},
@@ -484,30 +716,31 @@ class MoenAPI:
             "parse": False,
         }
 
-        try:
-            response = self.session.post(url, json=payload, timeout=30)
+        async with (
+            self._request_slots,
+            self.session.post(
+                url, json=payload, headers=self.headers, timeout=REQUEST_TIMEOUT
+            ) as response,
+        ):
             response.raise_for_status()
-
-            data = response.json()
-            if data.get("StatusCode") == 200:
-                payload_data = json.loads(data["Payload"])
-                session_data = payload_data.get("body", {})
-                _LOGGER.info("Retrieved session data for %s", client_id)
-                return session_data
-            else:
-                _LOGGER.error("Failed to get session data: %s", data)
-                raise requests.exceptions.RequestException("Failed to get session data")
-
-        except requests.exceptions.RequestException as err:
-            _LOGGER.error("Failed to get session data for %s: %s", client_id, err)
-            raise
-
-    def update_device_shadow(
+            data = await _read_json(response)
+
+        if data.get("StatusCode") == 200:
+            payload_data = _invoker_payload(data)
+            session_data = payload_data.get("body", {})
+            _LOGGER.info("Retrieved session data for %s", client_id)
+            return session_data
+        else:
+            _LOGGER.error("Failed to get session data: %s", data)
+            raise aiohttp.ClientError("Failed to get session data")
+
+    @_api_call("update device shadow for {client_id}")
+    async def update_device_shadow(
         self, client_id: str, payload_data: dict[str, Any]
     ) -> dict[str, Any]:
         """Update device shadow with new configuration."""
-        self._ensure_auth()
-
+        # The device state is about to change; never serve the old shadow
+        self.invalidate_shadow(client_id)
         url = f"{INVOKER_BASE}/invoker"
         payload = {
             "parse": False,
@@ -517,26 +750,21 @@ class MoenAPI:
         }
 
         try:
-            response = self.session.post(url, json=payload, timeout=30)
-            response.raise_for_status()
-
-            data = response.json()
-            if data.get("StatusCode") == 200:
-                payload_data = json.loads(data["Payload"])
-                result = payload_data.get("body", {})
-                _LOGGER.info("Updated device shadow for %s", client_id)
-                return result
-            else:
-                _LOGGER.error("Failed to update device shadow: %s", data)
-                raise requests.exceptions.RequestException(
-                    "Failed to update device shadow"
-                )
-
-        except requests.exceptions.RequestException as err:
-            _LOGGER.error("Failed to update device shadow for %s: %s", client_id, err)
-            raise
-
-    def start_water_flow(
+            data = await self._post_with_retry(url, payload, idempotent=False)
+        finally:
+            # A poll may have re-cached the old shadow while the command ran
+            self.invalidate_shadow(client_id)
+
+        if data.get("StatusCode") == 200:
+            response_payload = _invoker_payload(data)
+            result = response_payload.get("body", {})
+            _LOGGER.info("Updated device shadow for %s", client_id)
+            return result
+        else:
+            _LOGGER.error("Failed to update device shadow: %s", data)
+            raise aiohttp.ClientError("Failed to update device shadow")
+
+    async def start_water_flow(
         self, client_id: str, temperature: str | float = "coldest", flow_rate: int = 100
     ) -> dict[str, Any]:
         """Start water flow with specified temperature and flow rate."""
@@ -546,49 +774,48 @@ class MoenAPI:
             "temperature": temperature,
             "flowRate": flow_rate,
         }
-        return self.update_device_shadow(client_id, payload_data)
+        return await self.update_device_shadow(client_id, payload_data)
 
-    def stop_water_flow(self, client_id: str) -> dict[str, Any]:
+    async def stop_water_flow(self, client_id: str) -> dict[str, Any]:
         """Stop water flow."""
-        payload_data = {"commandSrc": "app", "command": "stop"}
-        return self.update_device_shadow(client_id, payload_data)
+        return await self.update_device_shadow(client_id, STOP_PAYLOAD)
 
-    def set_temperature(
+    async def set_temperature(
         self, client_id: str, temperature: str | float, flow_rate: int = 100
     ) -> dict[str, Any]:
         """Set specific temperature for water flow."""
-        return self.start_water_flow(client_id, temperature, flow_rate)
+        return await self.start_water_flow(client_id, temperature, flow_rate)
 
-    def set_coldest(self, client_id: str, flow_rate: int = 100) -> dict[str, Any]:
+    async def set_coldest(self, client_id: str, flow_rate: int = 100) -> dict[str, Any]:
         """Set water to coldest temperature."""
-        return self.start_water_flow(client_id, "coldest", flow_rate)
+        return await self.start_water_flow(client_id, "coldest", flow_rate)
 
-    def set_hottest(self, client_id: str, flow_rate: int = 100) -> dict[str, Any]:
+    async def set_hottest(self, client_id: str, flow_rate: int = 100) -> dict[str, Any]:
         """Set water to hottest temperature."""
-        return self.start_water_flow(client_id, "hottest", flow_rate)
+        return await self.start_water_flow(client_id, "hottest", flow_rate)
 
-    def set_warm(self, client_id: str, flow_rate: int = 100) -> dict[str, Any]:
+    async def set_warm(self, client_id: str, flow_rate: int = 100) -> dict[str, Any]:
         """Set water to warm temperature."""
-        return self.start_water_flow(client_id, "warm", flow_rate)
+        return await self.start_water_flow(client_id, "warm", flow_rate)
 
-    def set_specific_temperature(
+    async def set_specific_temperature(
         self, client_id: str, temperature_celsius: float, flow_rate: int = 100
     ) -> dict[str, Any]:
         """Set specific temperature in Celsius."""
-        return self.start_water_flow(client_id, temperature_celsius, flow_rate)
+        return await self.start_water_flow(client_id, temperature_celsius, flow_rate)
 
-    def update_device_settings(
+    async def update_device_settings(
         self, client_id: str, settings: dict[str, Any]
     ) -> dict[str, Any]:
         """Update various device settings."""
         payload_data = {"commandSrc": "app", **settings}
-        return self.update_device_shadow(client_id, payload_data)
+        return await self.update_device_shadow(client_id, payload_data)
 
-    def set_freeze_enable(self, client_id: str, enabled: bool) -> dict[str, Any]:
+    async def set_freeze_enable(self, client_id: str, enabled: bool) -> dict[str, Any]:
         """Enable or disable freeze protection."""
-        return self.update_device_settings(client_id, {"freezeEnable": enabled})
+        return await self.update_device_settings(client_id, {"freezeEnable": enabled})
 
-    def set_timeouts(
+    async def set_timeouts(
         self,
         client_id: str,
         handle_timeout: int = 300,
@@ -603,35 +830,70 @@ class MoenAPI:
             "voiceTimeout": voice_timeout,
             "dispenseActivateTimeout": dispense_activate_timeout,
         }
-        return self.update_device_settings(client_id, settings)
+        return await self.update_device_settings(client_id, settings)
 
-    def set_flow_rate(self, client_id: str, flow_rate: int) -> dict[str, Any]:
+    async def set_flow_rate(self, client_id: str, flow_rate: int) -> dict[str, Any]:
         """Set default flow rate."""
-        return self.update_device_settings(client_id, {"defaultFlowRate": flow_rate})
+        return await self.update_device_settings(
+            client_id, {"defaultFlowRate": flow_rate}
+        )
 
     # Convenience methods for getting cached data
-    def get_cached_devices(self) -> list[dict[str, Any]]:
-        """Get cached devices or fetch if not available."""
+    async def get_cached_devices(self) -> list[dict[str, Any]]:
+        """Get cached devices or fetch if not available.
+
+        Once the cached list is older than DEVICE_LIST_TTL it is still
+        returned, and a refresh is started in the background.
+        """
         if self._devices is None:
-            self.list_devices()
+            await self.list_devices()
+        elif time.monotonic() - self._devices_fetched_at > DEVICE_LIST_TTL and (
+            self._devices_refresh is None or self._devices_refresh.done()
+        ):
+            self._devices_refresh = asyncio.get_running_loop().create_task(
+                self._refresh_devices()
+            )
         return self._devices or []
 
-    def get_cached_locations(self) -> list[dict[str, Any]]:
+    async def _refresh_devices(self) -> None:
+        """Refresh the cached device list, keeping the old one on failure."""
+        try:
+            await self.list_devices()
+        except Exception as err:
+            # Nothing awaits this task, so no failure may escape it
+            _LOGGER.warning("Background device list refresh failed: %s", err)
+
+    def close(self) -> None:
+        """Cancel background work started by the client."""
+        if self._devices_refresh is not None:
+            self._devices_refresh.cancel()
+            self._devices_refresh = None
+
+    def invalidate_shadow(self, client_id: str) -> None:
+        """Drop the cached or in-flight shadow for a device."""
+        self._shadow_cache.pop(client_id, None)
+        self._shadow_requests.pop(client_id, None)
+
+    def invalidate_devices(self) -> None:
+        """Drop the cached device list so the next lookup refetches it."""
+        self._devices = None
+
+    async def get_cached_locations(self) -> list[dict[str, Any]]:
         """Get cached locations or fetch if not available."""
         if self._locations is None:
-            self.get_locations()
+            await self.get_locations()
         return self._locations or []
 
-    def get_cached_user_profile(self) -> dict[str, Any]:
+    async def get_cached_user_profile(self) -> dict[str, Any]:
         """Get cached user profile or fetch if not available."""
         if self._user_profile is None:
-            self.get_user_profile()
+            await self.get_user_profile()
         return self._user_profile or {}
 
-    def get_cached_temperature_definitions(self) -> dict[str, Any]:
+    async def get_cached_temperature_definitions(self) -> dict[str, Any]:
         """Get cached temperature definitions or fetch if not available."""
         if self._temperature_definitions is None:
-            self.get_user_details_and_temperature_definitions()
+            await self.get_user_details_and_temperature_definitions()
         return self._temperature_definitions or {}
 
     def get_tokens(self) -> dict[str, Any]:
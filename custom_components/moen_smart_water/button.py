@@ -3,49 +3,75 @@
 from __future__ import annotations
 
 import logging
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from typing import Any
 
 from homeassistant.components.button import ButtonEntity, ButtonEntityDescription
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
-from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
+from .api import MoenAPI
 from .coordinator import MoenDataUpdateCoordinator
+from .entity import MoenWriteIfChanged
 
 _LOGGER = logging.getLogger(__name__)
 
+
+@dataclass(frozen=True, kw_only=True)
+class MoenButtonEntityDescription(ButtonEntityDescription):
+    """Describes a Moen button and the API call it makes when pressed."""
+
+    press_fn: Callable[[MoenAPI, str], Awaitable[Any]]
+
+
 # Button descriptions
-START_WATER_BUTTON = ButtonEntityDescription(
+START_WATER_BUTTON = MoenButtonEntityDescription(
     key="start_water",
     name="Start Water",
     icon="mdi:play",
+    # Default to coldest temperature at full flow rate
+    press_fn=lambda api, device_id: api.start_water_flow(device_id, "coldest", 100),
 )
 
-STOP_WATER_BUTTON = ButtonEntityDescription(
+STOP_WATER_BUTTON = MoenButtonEntityDescription(
     key="stop_water",
     name="Stop Water",
     icon="mdi:stop",
+    press_fn=lambda api, device_id: api.stop_water_flow(device_id),
 )
 
-COLDEST_BUTTON = ButtonEntityDescription(
+COLDEST_BUTTON = MoenButtonEntityDescription(
     key="coldest",
     name="Coldest",
     icon="mdi:snowflake",
+    press_fn=lambda api, device_id: api.set_coldest(device_id, 100),
 )
 
-WARM_BUTTON = ButtonEntityDescription(
+WARM_BUTTON = MoenButtonEntityDescription(
     key="warm",
     name="Warm",
     icon="mdi:thermometer-lines",
+    press_fn=lambda api, device_id: api.set_warm(device_id, 100),
 )
 
-HOTTEST_BUTTON = ButtonEntityDescription(
+HOTTEST_BUTTON = MoenButtonEntityDescription(
     key="hottest",
     name="Hottest",
     icon="mdi:fire",
+    press_fn=lambda api, device_id: api.set_hottest(device_id, 100),
 )
 
+BUTTON_DESCRIPTIONS: list[MoenButtonEntityDescription] = [
+    START_WATER_BUTTON,
+    STOP_WATER_BUTTON,
+    COLDEST_BUTTON,
+    WARM_BUTTON,
+    HOTTEST_BUTTON,
+]
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -53,48 +79,43 @@ async def async_setup_entry(
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up Moen Smart Water button entities."""
-    coordinator: MoenDataUpdateCoordinator = hass.data["moen_smart_water"][
-        config_entry.entry_id
-    ]
+    coordinator: MoenDataUpdateCoordinator = config_entry.runtime_data
 
     # Get devices and create entities for each
     devices = coordinator.get_all_devices()
-    _LOGGER.info(
-        "Setting up button entities. Found %d devices: %s",
-        len(devices),
-        list(devices.keys()),
-    )
-
-    entities = []
-    for device_id, device in devices.items():
-        device_name = device.get("name", f"Moen Smart Water {device_id}")
+    if _LOGGER.isEnabledFor(logging.INFO):
         _LOGGER.info(
-            "Creating button entities for device %s: %s", device_id, device_name
+            "Setting up button entities. Found %d devices: %s",
+            len(devices),
+            list(devices),
         )
 
-        entities.extend(
-            [
-                MoenButton(coordinator, device_id, device_name, START_WATER_BUTTON),
-                MoenButton(coordinator, device_id, device_name, STOP_WATER_BUTTON),
-                MoenButton(coordinator, device_id, device_name, COLDEST_BUTTON),
-                MoenButton(coordinator, device_id, device_name, WARM_BUTTON),
-                MoenButton(coordinator, device_id, device_name, HOTTEST_BUTTON),
-            ]
+    entities = [
+        MoenButton(
+            coordinator,
+            device_id,
+            device.get("name", f"Moen Smart Water {device_id}"),
+            description,
         )
+        for device_id, device in devices.items()
+        for description in BUTTON_DESCRIPTIONS
+    ]
 
     _LOGGER.info("Adding %d button entities", len(entities))
     async_add_entities(entities)
 
 
-class MoenButton(CoordinatorEntity, ButtonEntity):
-    """Generic Moen button entity using ButtonEntityDescription."""
+class MoenButton(MoenWriteIfChanged, CoordinatorEntity, ButtonEntity):
+    """Generic Moen button entity using MoenButtonEntityDescription."""
+
+    entity_description: MoenButtonEntityDescription
 
     def __init__(
         self,
         coordinator: MoenDataUpdateCoordinator,
         device_id: str,
         device_name: str,
-        description: ButtonEntityDescription,
+        description: MoenButtonEntityDescription,
     ) -> None:
         """Initialize the button entity."""
         super().__init__(coordinator)
@@ -105,57 +126,22 @@ class MoenButton(CoordinatorEntity, ButtonEntity):
         self._attr_unique_id = f"{device_id}_{description.key}"
 
         # Device information
-        self._attr_device_info = DeviceInfo(
-            identifiers={("moen_smart_water", device_id)},
-            name=device_name,
-            manufacturer="Moen",
-            model="Smart Faucet",
-        )
+        self._attr_device_info = coordinator.get_device_info(device_id)
+
+    def _handle_coordinator_update(self) -> None:
+        """Handle updated data from the coordinator."""
+        # A button has no state of its own; only availability can change
+        self._async_write_state_if_changed()
 
     async def async_press(self) -> None:
         """Handle the button press."""
         key = self.entity_description.key
 
         try:
-            if key == "start_water":
-                await self.hass.async_add_executor_job(
-                    self.coordinator.api.start_water_flow,
-                    self._device_id,
-                    "coldest",  # Default to coldest temperature
-                    100,  # Default to full flow rate
-                )
-                _LOGGER.info("Started water flow for device %s", self._device_id)
-
-            elif key == "stop_water":
-                await self.hass.async_add_executor_job(
-                    self.coordinator.api.stop_water_flow, self._device_id
-                )
-                _LOGGER.info("Stopped water flow for device %s", self._device_id)
-
-            elif key == "coldest":
-                await self.hass.async_add_executor_job(
-                    self.coordinator.api.set_coldest,
-                    self._device_id,
-                    100,  # Full flow rate
-                )
-                _LOGGER.info("Set coldest temperature for device %s", self._device_id)
-
-            elif key == "warm":
-                await self.hass.async_add_executor_job(
-                    self.coordinator.api.set_warm,
-                    self._device_id,
-                    100,  # Full flow rate
-                )
-                _LOGGER.info("Set warm temperature for device %s", self._device_id)
-
-            elif key == "hottest":
-                await self.hass.async_add_executor_job(
-                    self.coordinator.api.set_hottest,
-                    self._device_id,
-                    100,  # Full flow rate
-                )
-                _LOGGER.info("Set hottest temperature for device %s", self._device_id)
-
+            await self.entity_description.press_fn(
+                self.coordinator.api, self._device_id
+            )
+            _LOGGER.debug("Pressed %s for device %s", key, self._device_id)
         except Exception as err:
             _LOGGER.error(
                 "Failed to execute %s action for device %s: %s",
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
 from typing import Any
 
@@ -11,6 +12,7 @@ from homeassistant.const import CONF_PASSWORD, CONF_USERNAME
 from homeassistant.core import HomeAssistant
 from homeassistant.data_entry_flow import FlowResult
 from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
 
 from .api import MoenAPI
 
@@ -35,32 +37,35 @@ class InvalidAuth(HomeAssistantError):
 async def validate_input(hass: HomeAssistant, data: dict[str, Any]) -> dict[str, Any]:
     """Validate the user input allows us to connect."""
     api = MoenAPI(
+        session=async_get_clientsession(hass),
         username=data[CONF_USERNAME],
         password=data[CONF_PASSWORD],
     )
 
     try:
         # Test the connection
-        await hass.async_add_executor_job(api.login)
+        await api.login()
 
-        # Test the /users/me endpoint to verify authentication works
-        user_profile = await hass.async_add_executor_job(api.get_user_profile)
+        # Test the /users/me endpoint and look for devices in one round trip;
+        # both only need the token obtained above
+        user_profile, devices = await asyncio.gather(
+            api.get_user_profile(), api.list_devices(), return_exceptions=True
+        )
+        if isinstance(user_profile, BaseException):
+            raise user_profile
         _LOGGER.info(
             "Successfully authenticated and retrieved user profile: %s",
             user_profile.get("email", "unknown"),
         )
 
-        # Try to get devices to see if we can find any
-        try:
-            devices = await hass.async_add_executor_job(api.list_devices)
-            device_count = len(devices) if devices else 0
-            _LOGGER.info("Found %d devices", device_count)
-        except Exception as device_err:
+        # A device listing failure does not invalidate the credentials
+        if isinstance(devices, BaseException):
             _LOGGER.warning(
-                "Could not retrieve devices, but authentication works: %s", device_err
+                "Could not retrieve devices, but authentication works: %s", devices
             )
             devices = []
-            device_count = 0
+        device_count = len(devices) if devices else 0
+        _LOGGER.info("Found %d devices", device_count)
 
         return {
             "title": f"Moen Smart Water ({user_profile.get('firstName', 'User')} - {device_count} devices)",
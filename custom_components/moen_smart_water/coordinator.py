@@ -3,11 +3,12 @@
 from __future__ import annotations
 
 import logging
-from datetime import timedelta
+from datetime import UTC, datetime, timedelta
 from typing import Any
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
 from .api import MoenAPI
@@ -17,6 +18,30 @@ _LOGGER = logging.getLogger(__name__)
 # Polling interval - update every 30 seconds
 SCAN_INTERVAL = timedelta(seconds=30)
 
+# Poll faster while water is running so flow and state changes show up quickly
+ACTIVE_SCAN_INTERVAL = timedelta(seconds=10)
+
+
+async def async_store_tokens(
+    hass: HomeAssistant, entry: ConfigEntry, tokens: dict[str, Any]
+) -> None:
+    """Store tokens in the config entry."""
+    # Tokens only change on login or refresh; skip the entry update otherwise
+    if entry.data.get("tokens") == tokens:
+        return
+
+    # Update the config entry with new tokens
+    new_data = {**entry.data, "tokens": tokens}
+    hass.config_entries.async_update_entry(entry, data=new_data)
+
+
+def _reported_state(shadow: dict[str, Any]) -> dict[str, Any]:
+    """Return the reported state from a device shadow."""
+    try:
+        return shadow["state"]["reported"]
+    except (KeyError, TypeError):
+        return {}
+
 
 class MoenDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
     """Class to manage fetching data from the Moen API."""
@@ -25,9 +50,16 @@ class MoenDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         """Initialize the coordinator."""
         self.api = api
         self.entry = entry
+        self._device_list: list[dict[str, Any]] | None = None
         self._devices: dict[str, dict[str, Any]] = {}
         self._device_shadows: dict[str, dict[str, Any]] = {}
+        # device_id -> shadow["state"]["reported"], for devices with a shadow
+        self._reported_states: dict[str, dict[str, Any]] = {}
         self._device_details: dict[str, dict[str, Any]] = {}
+        # device_id -> DeviceInfo shared by all of the device's entities
+        self._device_info: dict[str, DeviceInfo] = {}
+        # When the last successful update finished
+        self.last_update_time: datetime | None = None
 
         super().__init__(
             hass,
@@ -40,39 +72,38 @@ class MoenDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         """Update data via library."""
         try:
             # Get fresh device list
-            devices = await self.hass.async_add_executor_job(
-                self.api.get_cached_devices
-            )
-
-            # Update device cache
-            self._devices = {
-                device.get("clientId", device.get("id", "")): device
-                for device in devices
+            devices = await self.api.get_cached_devices()
+
+            # Update device cache; the API hands back the same list object
+            # until it actually refreshes it, so only re-index a new list
+            if devices is not self._device_list:
+                self._device_list = devices
+                self._devices = {
+                    device.get("clientId", device.get("id", "")): device
+                    for device in devices
+                }
+
+            # Get device shadows for all devices (operational data) in one batch
+            shadows = await self.api.get_device_shadows(list(self._devices))
+
+            # All diagnostic data is available in device shadows; use an empty
+            # shadow for devices we couldn't get one for
+            self._device_shadows = {
+                device_id: shadows.get(device_id, {}) for device_id in self._devices
+            }
+            # Entities only read the reported state; extract it once per poll
+            self._reported_states = {
+                device_id: _reported_state(shadow)
+                for device_id, shadow in self._device_shadows.items()
+                if shadow
             }
-
-            # Get device shadows for all devices (operational data)
-            device_shadows = {}
-            for device_id in self._devices.keys():
-                try:
-                    # Get device shadow
-                    shadow = await self.hass.async_add_executor_job(
-                        self.api.get_device_shadow, device_id
-                    )
-                    device_shadows[device_id] = shadow
-                except Exception as err:
-                    _LOGGER.warning(
-                        "Failed to get shadow for device %s: %s", device_id, err
-                    )
-                    # Use empty shadow if we can't get it
-                    device_shadows[device_id] = {}
-
-            # All diagnostic data is now available in device shadows
-            self._device_shadows = device_shadows
 
             # Store updated tokens if they were refreshed
-            from . import _store_tokens
+            await async_store_tokens(self.hass, self.entry, self.api.get_tokens())
 
-            await _store_tokens(self.hass, self.entry, self.api.get_tokens())
+            self.last_update_time = datetime.now(UTC)
+
+            self.update_interval = self._scan_interval()
 
             return {
                 "devices": self._devices,
@@ -84,14 +115,70 @@ class MoenDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             _LOGGER.error("Error communicating with Moen API: %s", err)
             raise UpdateFailed(f"Error communicating with Moen API: {err}") from err
 
+    def _scan_interval(self) -> timedelta:
+        """Return the polling interval for the current device states."""
+        # Only device state is polled faster; the device list keeps its own TTL
+        if any(
+            state.get("state") == "running" for state in self._reported_states.values()
+        ):
+            return ACTIVE_SCAN_INTERVAL
+        return SCAN_INTERVAL
+
     def get_device(self, device_id: str) -> dict[str, Any] | None:
         """Get device data by ID."""
         return self._devices.get(device_id)
 
+    def get_device_info(self, device_id: str) -> DeviceInfo:
+        """Get the device registry info shared by a device's entities."""
+        device_info = self._device_info.get(device_id)
+        if device_info is None:
+            device = self._devices.get(device_id, {})
+            device_info = self._device_info[device_id] = DeviceInfo(
+                identifiers={("moen_smart_water", device_id)},
+                name=device.get("name", f"Moen Smart Water {device_id}"),
+                manufacturer="Moen",
+                model="Smart Faucet",
+            )
+        return device_info
+
     def get_device_shadow(self, device_id: str) -> dict[str, Any] | None:
         """Get device shadow data by ID."""
         return self._device_shadows.get(device_id)
 
+    def get_reported_state(self, device_id: str) -> dict[str, Any] | None:
+        """Get the reported state from a device's shadow.
+
+        Returns None if no shadow could be fetched for the device.
+        """
+        return self._reported_states.get(device_id)
+
+    @callback
+    def async_set_reported_state(self, device_id: str, changes: dict[str, Any]) -> None:
+        """Apply a commanded state change before the next poll confirms it.
+
+        The next refresh replaces this with what the device actually reports.
+        """
+        state = self._reported_states.get(device_id)
+        if state is None:
+            return
+        # Copy rather than update, the shadow may still be shared elsewhere
+        state = self._reported_states[device_id] = {**state, **changes}
+        # Keep the shadow in step so shadow readers see the same state
+        shadow = self._device_shadows[device_id]
+        self._device_shadows[device_id] = {
+            **shadow,
+            "state": {**shadow.get("state", {}), "reported": state},
+        }
+
+        interval = self._scan_interval()
+        if interval != self.update_interval:
+            self.update_interval = interval
+            # Move the pending poll onto the new interval
+            if self._listeners:
+                self._schedule_refresh()
+
+        self.async_update_listeners()
+
     def get_all_devices(self) -> dict[str, dict[str, Any]]:
         """Get all devices."""
         return self._devices
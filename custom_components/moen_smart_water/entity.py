@@ -0,0 +1,28 @@
+"""Shared entity helpers for Moen Smart Water integration."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.core import callback
+from homeassistant.helpers.entity import Entity
+
+
+class MoenWriteIfChanged(Entity):
+    """Mixin that skips state writes when nothing the entity shows changed."""
+
+    # (value, available) as of the last state write
+    _written_state: tuple[Any, bool] | None = None
+
+    @property
+    def _state_value(self) -> Any:
+        """Return the value compared against the last written state."""
+        return None
+
+    @callback
+    def _async_write_state_if_changed(self) -> None:
+        """Write state only when the value or availability changed."""
+        state = (self._state_value, self.available)
+        if state != self._written_state:
+            self._written_state = state
+            self.async_write_ha_state()
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import logging
+from typing import Any
 
 from homeassistant.components.number import (
     NumberEntity,
@@ -11,12 +12,12 @@ from homeassistant.components.number import (
 )
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
-from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity import EntityCategory
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .coordinator import MoenDataUpdateCoordinator
+from .entity import MoenWriteIfChanged
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -44,43 +45,45 @@ FLOW_RATE_NUMBER = NumberEntityDescription(
 )
 
 
+NUMBER_DESCRIPTIONS: list[NumberEntityDescription] = [
+    TEMPERATURE_NUMBER,
+    FLOW_RATE_NUMBER,
+]
+
+
 async def async_setup_entry(
     hass: HomeAssistant,
     config_entry: ConfigEntry,
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up Moen Smart Water number entities."""
-    coordinator: MoenDataUpdateCoordinator = hass.data["moen_smart_water"][
-        config_entry.entry_id
-    ]
+    coordinator: MoenDataUpdateCoordinator = config_entry.runtime_data
 
     # Get devices and create entities for each
     devices = coordinator.get_all_devices()
-    _LOGGER.info(
-        "Setting up number entities. Found %d devices: %s",
-        len(devices),
-        list(devices.keys()),
-    )
-
-    entities = []
-    for device_id, device in devices.items():
-        device_name = device.get("name", f"Moen Smart Water {device_id}")
+    if _LOGGER.isEnabledFor(logging.INFO):
         _LOGGER.info(
-            "Creating number entities for device %s: %s", device_id, device_name
+            "Setting up number entities. Found %d devices: %s",
+            len(devices),
+            list(devices),
         )
 
-        entities.extend(
-            [
-                MoenNumber(coordinator, device_id, device_name, TEMPERATURE_NUMBER),
-                MoenNumber(coordinator, device_id, device_name, FLOW_RATE_NUMBER),
-            ]
+    entities = [
+        MoenNumber(
+            coordinator,
+            device_id,
+            device.get("name", f"Moen Smart Water {device_id}"),
+            description,
         )
+        for device_id, device in devices.items()
+        for description in NUMBER_DESCRIPTIONS
+    ]
 
     _LOGGER.info("Adding %d number entities", len(entities))
     async_add_entities(entities)
 
 
-class MoenNumber(CoordinatorEntity, NumberEntity):
+class MoenNumber(MoenWriteIfChanged, CoordinatorEntity, NumberEntity):
     """Generic Moen number entity using NumberEntityDescription."""
 
     def __init__(
@@ -106,21 +109,20 @@ class MoenNumber(CoordinatorEntity, NumberEntity):
             self._attr_native_value = 0
 
         # Device information
-        self._attr_device_info = DeviceInfo(
-            identifiers={("moen_smart_water", device_id)},
-            name=device_name,
-            manufacturer="Moen",
-            model="Smart Faucet",
-        )
+        self._attr_device_info = coordinator.get_device_info(device_id)
+
+    @property
+    def _state_value(self) -> Any:
+        """Return the value compared against the last written state."""
+        return self._attr_native_value
 
     def _handle_coordinator_update(self) -> None:
         """Handle updated data from the coordinator."""
-        shadow = self.coordinator.get_device_shadow(self._device_id)
-        if not shadow:
-            self.async_write_ha_state()
+        state = self.coordinator.get_reported_state(self._device_id)
+        if state is None:
+            self._async_write_state_if_changed()
             return
 
-        state = shadow.get("state", {}).get("reported", {})
         key = self.entity_description.key
 
         if key == "temperature":
@@ -128,7 +130,7 @@ class MoenNumber(CoordinatorEntity, NumberEntity):
         elif key == "flow_rate":
             self._attr_native_value = state.get("flowRate", 0)
 
-        self.async_write_ha_state()
+        self._async_write_state_if_changed()
 
     async def async_set_native_value(self, value: float) -> None:
         """Set the number value."""
@@ -136,22 +138,19 @@ class MoenNumber(CoordinatorEntity, NumberEntity):
 
         try:
             if key == "temperature":
-                await self.hass.async_add_executor_job(
-                    self.coordinator.api.set_specific_temperature,
+                await self.coordinator.api.set_specific_temperature(
                     self._device_id,
                     value,
                 )
                 self._attr_native_value = value
-                _LOGGER.info(
+                _LOGGER.debug(
                     "Set temperature to %.1f°C for device %s", value, self._device_id
                 )
 
             elif key == "flow_rate":
-                await self.hass.async_add_executor_job(
-                    self.coordinator.api.set_flow_rate, self._device_id, int(value)
-                )
+                await self.coordinator.api.set_flow_rate(self._device_id, int(value))
                 self._attr_native_value = int(value)
-                _LOGGER.info(
+                _LOGGER.debug(
                     "Set flow rate to %d%% for device %s", int(value), self._device_id
                 )
 
@@ -3,19 +3,39 @@
 from __future__ import annotations
 
 import logging
+from bisect import bisect_left
+from collections.abc import Awaitable, Callable
+from typing import Any
 
 from homeassistant.components.select import SelectEntity, SelectEntityDescription
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
-from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity import EntityCategory
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
+from .api import MoenAPI
 from .coordinator import MoenDataUpdateCoordinator
+from .entity import MoenWriteIfChanged
 
 _LOGGER = logging.getLogger(__name__)
 
+# Upper temperature bound (inclusive, °C) of each preset; anything above the
+# last threshold is "hottest"
+PRESET_THRESHOLDS = (10, 25, 40, 60)
+PRESET_LABELS = ("coldest", "cold", "warm", "hot", "hottest")
+
+# API call for each temperature preset option; "custom" has none and is set
+# through the temperature number entity instead
+PRESET_OPTION_FNS: dict[str, Callable[[MoenAPI, str], Awaitable[Any]]] = {
+    "coldest": lambda api, device_id: api.set_coldest(device_id),
+    "hottest": lambda api, device_id: api.set_hottest(device_id),
+    "warm": lambda api, device_id: api.set_warm(device_id),
+    # Cold and hot map to fixed temperatures (15°C / 50°C)
+    "cold": lambda api, device_id: api.set_specific_temperature(device_id, 15.0),
+    "hot": lambda api, device_id: api.set_specific_temperature(device_id, 50.0),
+}
+
 # Select descriptions
 TEMPERATURE_PRESET_SELECT = SelectEntityDescription(
     key="temperature_preset",
@@ -26,30 +46,37 @@ TEMPERATURE_PRESET_SELECT = SelectEntityDescription(
 )
 
 
+SELECT_DESCRIPTIONS: list[SelectEntityDescription] = [
+    TEMPERATURE_PRESET_SELECT,
+]
+
+
 async def async_setup_entry(
     hass: HomeAssistant,
     config_entry: ConfigEntry,
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up Moen Smart Water select entities."""
-    coordinator: MoenDataUpdateCoordinator = hass.data["moen_smart_water"][
-        config_entry.entry_id
-    ]
+    coordinator: MoenDataUpdateCoordinator = config_entry.runtime_data
 
     # Get devices and create entities for each
     devices = coordinator.get_all_devices()
 
-    entities = []
-    for device_id, device in devices.items():
-        device_name = device.get("name", f"Moen Smart Water {device_id}")
-        entities.append(
-            MoenSelect(coordinator, device_id, device_name, TEMPERATURE_PRESET_SELECT)
+    entities = [
+        MoenSelect(
+            coordinator,
+            device_id,
+            device.get("name", f"Moen Smart Water {device_id}"),
+            description,
         )
+        for device_id, device in devices.items()
+        for description in SELECT_DESCRIPTIONS
+    ]
 
     async_add_entities(entities)
 
 
-class MoenSelect(CoordinatorEntity, SelectEntity):
+class MoenSelect(MoenWriteIfChanged, CoordinatorEntity, SelectEntity):
     """Generic Moen select entity using SelectEntityDescription."""
 
     def __init__(
@@ -68,45 +95,35 @@ class MoenSelect(CoordinatorEntity, SelectEntity):
         self._attr_unique_id = f"{device_id}_{description.key}"
 
         # Device information
-        self._attr_device_info = DeviceInfo(
-            identifiers={("moen_smart_water", device_id)},
-            name=device_name,
-            manufacturer="Moen",
-            model="Smart Faucet",
-        )
+        self._attr_device_info = coordinator.get_device_info(device_id)
 
         # Set initial option
         self._attr_current_option = (
             description.options[0] if description.options else ""
         )
 
+    @property
+    def _state_value(self) -> Any:
+        """Return the value compared against the last written state."""
+        return self._attr_current_option
+
     def _handle_coordinator_update(self) -> None:
         """Handle updated data from the coordinator."""
-        shadow = self.coordinator.get_device_shadow(self._device_id)
-        if not shadow:
-            self.async_write_ha_state()
+        state = self.coordinator.get_reported_state(self._device_id)
+        if state is None:
+            self._async_write_state_if_changed()
             return
 
-        state = shadow.get("state", {}).get("reported", {})
         key = self.entity_description.key
 
         if key == "temperature_preset":
             # Determine current temperature preset based on temperature value
             temperature = state.get("temperature", 20.0)
-            if temperature <= 10:
-                self._attr_current_option = "coldest"
-            elif temperature <= 25:
-                self._attr_current_option = "cold"
-            elif temperature <= 40:
-                self._attr_current_option = "warm"
-            elif temperature <= 60:
-                self._attr_current_option = "hot"
-            elif temperature > 60:
-                self._attr_current_option = "hottest"
-            else:
-                self._attr_current_option = "custom"
-
-        self.async_write_ha_state()
+            self._attr_current_option = PRESET_LABELS[
+                bisect_left(PRESET_THRESHOLDS, temperature)
+            ]
+
+        self._async_write_state_if_changed()
 
     async def async_select_option(self, option: str) -> None:
         """Change the selected option."""
@@ -114,33 +131,9 @@ class MoenSelect(CoordinatorEntity, SelectEntity):
 
         try:
             if key == "temperature_preset":
-                # Map options to API calls
-                if option == "coldest":
-                    await self.hass.async_add_executor_job(
-                        self.coordinator.api.set_coldest, self._device_id
-                    )
-                elif option == "hottest":
-                    await self.hass.async_add_executor_job(
-                        self.coordinator.api.set_hottest, self._device_id
-                    )
-                elif option == "warm":
-                    await self.hass.async_add_executor_job(
-                        self.coordinator.api.set_warm, self._device_id
-                    )
-                elif option == "cold":
-                    # Set to a cold temperature (15°C)
-                    await self.hass.async_add_executor_job(
-                        self.coordinator.api.set_specific_temperature,
-                        self._device_id,
-                        15.0,
-                    )
-                elif option == "hot":
-                    # Set to a hot temperature (50°C)
-                    await self.hass.async_add_executor_job(
-                        self.coordinator.api.set_specific_temperature,
-                        self._device_id,
-                        50.0,
-                    )
+                option_fn = PRESET_OPTION_FNS.get(option)
+                if option_fn is not None:
+                    await option_fn(self.coordinator.api, self._device_id)
                 elif option == "custom":
                     # For custom, we'll let the user set specific temperature via number entity
                     _LOGGER.info(
@@ -148,7 +141,7 @@ class MoenSelect(CoordinatorEntity, SelectEntity):
                     )
 
             self._attr_current_option = option
-            _LOGGER.info("Set %s to %s for device %s", key, option, self._device_id)
+            _LOGGER.debug("Set %s to %s for device %s", key, option, self._device_id)
         except Exception as err:
             _LOGGER.error(
                 "Failed to set %s for device %s: %s",
@@ -3,20 +3,25 @@
 from __future__ import annotations
 
 import logging
+from collections.abc import Callable
+from datetime import UTC, datetime
+from functools import lru_cache
+from typing import Any
 
 from homeassistant.components.sensor import (
     SensorDeviceClass,
     SensorEntity,
     SensorEntityDescription,
+    SensorStateClass,
 )
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
-from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity import EntityCategory
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .coordinator import MoenDataUpdateCoordinator
+from .entity import MoenWriteIfChanged
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -27,6 +32,7 @@ TEMPERATURE_SENSOR = SensorEntityDescription(
     native_unit_of_measurement="°C",
     device_class=SensorDeviceClass.TEMPERATURE,
     icon="mdi:thermometer",
+    state_class=SensorStateClass.MEASUREMENT,
 )
 
 FLOW_RATE_SENSOR = SensorEntityDescription(
@@ -34,6 +40,7 @@ FLOW_RATE_SENSOR = SensorEntityDescription(
     name="Flow Rate",
     native_unit_of_measurement="%",
     icon="mdi:water-percent",
+    state_class=SensorStateClass.MEASUREMENT,
 )
 
 FAUCET_STATE_SENSOR = SensorEntityDescription(
@@ -77,6 +84,7 @@ WIFI_RSSI_SENSOR = SensorEntityDescription(
     native_unit_of_measurement="dBm",
     device_class=SensorDeviceClass.SIGNAL_STRENGTH,
     entity_category=EntityCategory.DIAGNOSTIC,
+    state_class=SensorStateClass.MEASUREMENT,
 )
 
 WIFI_CONNECTED_SENSOR = SensorEntityDescription(
@@ -91,6 +99,7 @@ BATTERY_SENSOR = SensorEntityDescription(
     native_unit_of_measurement="%",
     device_class=SensorDeviceClass.BATTERY,
     entity_category=EntityCategory.DIAGNOSTIC,
+    state_class=SensorStateClass.MEASUREMENT,
 )
 
 FIRMWARE_VERSION_SENSOR = SensorEntityDescription(
@@ -108,64 +117,120 @@ LAST_CONNECT_SENSOR = SensorEntityDescription(
 )
 
 
+SENSOR_DESCRIPTIONS: list[SensorEntityDescription] = [
+    # Essential sensors
+    FAUCET_STATE_SENSOR,
+    LAST_DISPENSE_VOLUME_SENSOR,
+    TEMPERATURE_SENSOR,
+    FLOW_RATE_SENSOR,
+    # Diagnostic sensors
+    API_STATUS_SENSOR,
+    LAST_UPDATE_SENSOR,
+    WIFI_NETWORK_SENSOR,
+    WIFI_RSSI_SENSOR,
+    WIFI_CONNECTED_SENSOR,
+    BATTERY_SENSOR,
+    FIRMWARE_VERSION_SENSOR,
+    LAST_CONNECT_SENSOR,
+]
+
+
+def _last_dispense_volume(state: dict[str, Any]) -> float | None:
+    """Return the last dispensed volume in mL."""
+    # Device shadow uses 'volume' field, not 'lastDispenseVolume'
+    # Convert from μL to mL for better readability (divide by 1000)
+    volume_ul = state.get("volume")
+    return volume_ul / 1000.0 if volume_ul is not None else None
+
+
+def _flow_rate(state: dict[str, Any]) -> Any:
+    """Return the flow rate, treating "unknown" as no value."""
+    flow_rate = state.get("flowRate")
+    return None if flow_rate == "unknown" else flow_rate
+
+
+def _api_status(state: dict[str, Any]) -> str:
+    """Return the connection status reported in the shadow."""
+    if state.get("connected", False):
+        return f"Connected - {state.get('state', 'unknown').title()}"
+    return "Disconnected"
+
+
+def _wifi_connected(state: dict[str, Any]) -> str:
+    """Return the WiFi status, assuming connected if we have signal data."""
+    return "connected" if state.get("wifiRssi") is not None else "disconnected"
+
+
+def _last_connect(state: dict[str, Any]) -> datetime | None:
+    """Return when the device last connected to the cloud."""
+    last_connect = state.get("lastConnect")
+    if not last_connect:
+        return None
+    try:
+        return _parse_last_connect(last_connect)
+    except (ValueError, TypeError):
+        return None
+
+
+@lru_cache(maxsize=16)
+def _parse_last_connect(last_connect: str | float) -> datetime:
+    """Parse a lastConnect value; it rarely changes between polls."""
+    if isinstance(last_connect, str):
+        # Parse ISO string; a trailing "Z" is accepted since Python 3.11
+        return datetime.fromisoformat(last_connect)
+    # Convert timestamp to datetime
+    return datetime.fromtimestamp(last_connect / 1000, tz=UTC)
+
+
+# Sensor key -> native value derived from the device's reported state
+VALUE_FNS: dict[str, Callable[[dict[str, Any]], Any]] = {
+    "faucet_state": lambda state: state.get("state", "idle"),
+    "last_dispense_volume": _last_dispense_volume,
+    "temperature": lambda state: state.get("temperature"),
+    "flow_rate": _flow_rate,
+    "api_status": _api_status,
+    "wifi_network": lambda state: state.get("wifiNetwork"),
+    "wifi_rssi": lambda state: state.get("wifiRssi"),
+    "wifi_connected": _wifi_connected,
+    "battery_percentage": lambda state: state.get("batteryPercentage"),
+    "firmware_version": lambda state: state.get("firmwareVersion"),
+    "last_connect": _last_connect,
+}
+
+
 async def async_setup_entry(
     hass: HomeAssistant,
     config_entry: ConfigEntry,
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up Moen Smart Water sensor entities."""
-    coordinator: MoenDataUpdateCoordinator = hass.data["moen_smart_water"][
-        config_entry.entry_id
-    ]
+    coordinator: MoenDataUpdateCoordinator = config_entry.runtime_data
 
     # Get devices and create entities for each
     devices = coordinator.get_all_devices()
-    _LOGGER.info(
-        "Setting up sensor entities. Found %d devices: %s",
-        len(devices),
-        list(devices.keys()),
-    )
-
-    entities = []
-    for device_id, device in devices.items():
-        device_name = device.get("name", f"Moen Smart Water {device_id}")
+    if _LOGGER.isEnabledFor(logging.INFO):
         _LOGGER.info(
-            "Creating sensor entities for device %s: %s", device_id, device_name
-        )
-
-        # Essential sensors
-        entities.extend(
-            [
-                MoenSensor(coordinator, device_id, device_name, FAUCET_STATE_SENSOR),
-                MoenSensor(
-                    coordinator, device_id, device_name, LAST_DISPENSE_VOLUME_SENSOR
-                ),
-                MoenSensor(coordinator, device_id, device_name, TEMPERATURE_SENSOR),
-                MoenSensor(coordinator, device_id, device_name, FLOW_RATE_SENSOR),
-            ]
+            "Setting up sensor entities. Found %d devices: %s",
+            len(devices),
+            list(devices),
         )
 
-        # Diagnostic sensors
-        entities.extend(
-            [
-                MoenSensor(coordinator, device_id, device_name, API_STATUS_SENSOR),
-                MoenSensor(coordinator, device_id, device_name, LAST_UPDATE_SENSOR),
-                MoenSensor(coordinator, device_id, device_name, WIFI_NETWORK_SENSOR),
-                MoenSensor(coordinator, device_id, device_name, WIFI_RSSI_SENSOR),
-                MoenSensor(coordinator, device_id, device_name, WIFI_CONNECTED_SENSOR),
-                MoenSensor(coordinator, device_id, device_name, BATTERY_SENSOR),
-                MoenSensor(
-                    coordinator, device_id, device_name, FIRMWARE_VERSION_SENSOR
-                ),
-                MoenSensor(coordinator, device_id, device_name, LAST_CONNECT_SENSOR),
-            ]
+    entities = [
+        MoenSensor(
+            coordinator,
+            device_id,
+            device.get("name", f"Moen Smart Water {device_id}"),
+            description,
         )
+        for device_id, device in devices.items()
+        for description in SENSOR_DESCRIPTIONS
+    ]
 
     _LOGGER.info("Adding %d sensor entities", len(entities))
     async_add_entities(entities)
 
 
-class MoenSensor(CoordinatorEntity, SensorEntity):
+class MoenSensor(MoenWriteIfChanged, CoordinatorEntity, SensorEntity):
     """Generic Moen sensor entity using SensorEntityDescription."""
 
     def __init__(
@@ -182,14 +247,11 @@ class MoenSensor(CoordinatorEntity, SensorEntity):
         self.entity_description = description
         self._attr_has_entity_name = True
         self._attr_unique_id = f"{device_id}_{description.key}"
+        # Resolved once; None for last_update, which reads the coordinator
+        self._value_fn = VALUE_FNS.get(description.key)
 
         # Device information
-        self._attr_device_info = DeviceInfo(
-            identifiers={("moen_smart_water", self._device_id)},
-            name=self._device_name,
-            manufacturer="Moen",
-            model="Smart Faucet",
-        )
+        self._attr_device_info = coordinator.get_device_info(device_id)
 
         # Set initial value based on sensor type
         # Numeric sensors should start with None to avoid ValueError
@@ -208,94 +270,31 @@ class MoenSensor(CoordinatorEntity, SensorEntity):
         else:
             self._attr_native_value = "loading"
 
+    @property
+    def _state_value(self) -> Any:
+        """Return the value compared against the last written state."""
+        return self._attr_native_value
+
     def _handle_coordinator_update(self) -> None:
         """Handle updated data from the coordinator."""
-        shadow = self.coordinator.get_device_shadow(self._device_id)
+        state = self.coordinator.get_reported_state(self._device_id)
 
-        if not shadow:
-            if self.entity_description.key == "api_status":
+        if state is None:
+            key = self.entity_description.key
+            if key == "api_status":
                 self._attr_native_value = "No Data"
-            elif self.entity_description.key == "last_update":
+            elif key == "last_update":
                 self._attr_native_value = "failed"
             else:
                 self._attr_native_value = None
-            self.async_write_ha_state()
-            return
-
-        state = shadow.get("state", {}).get("reported", {})
-        key = self.entity_description.key
-
-        # Operational sensors from device shadow
-        if key == "faucet_state":
-            # Use device state directly
-            self._attr_native_value = state.get("state", "idle")
-        elif key == "last_dispense_volume":
-            # Device shadow uses 'volume' field, not 'lastDispenseVolume'
-            # Convert from μL to mL for better readability (divide by 1000)
-            volume_ul = state.get("volume")
-            if volume_ul is not None:
-                self._attr_native_value = volume_ul / 1000.0
-            else:
-                self._attr_native_value = None
-        elif key == "temperature":
-            self._attr_native_value = state.get("temperature")
-        elif key == "flow_rate":
-            # Handle "unknown" values by setting to None
-            flow_rate = state.get("flowRate")
-            self._attr_native_value = None if flow_rate == "unknown" else flow_rate
-        elif key == "api_status":
-            if shadow:
-                # Use actual API values for connected and state from shadow
-                connected = state.get("connected", False)
-                device_state = state.get("state", "unknown")
-                if connected:
-                    self._attr_native_value = f"Connected - {device_state.title()}"
-                else:
-                    self._attr_native_value = "Disconnected"
-            else:
-                self._attr_native_value = "No Data"
-        elif key == "last_update":
-            if self.coordinator.last_update_success:
-                from datetime import datetime, timezone
-
-                self._attr_native_value = datetime.now(timezone.utc)  # noqa: UP017
-            else:
-                self._attr_native_value = None
-
-        # Diagnostic sensors from device shadow (all data is in shadow)
-        elif key == "wifi_network":
-            self._attr_native_value = state.get("wifiNetwork")
-        elif key == "wifi_rssi":
-            self._attr_native_value = state.get("wifiRssi")
-        elif key == "wifi_connected":
-            # WiFi connected status - assume connected if we have signal data
+        elif self._value_fn is not None:
+            self._attr_native_value = self._value_fn(state)
+        else:
+            # last_update: one timestamp per refresh, shared by every device
             self._attr_native_value = (
-                "connected" if state.get("wifiRssi") is not None else "disconnected"
+                self.coordinator.last_update_time
+                if self.coordinator.last_update_success
+                else None
             )
-        elif key == "battery_percentage":
-            self._attr_native_value = state.get("batteryPercentage")
-        elif key == "firmware_version":
-            self._attr_native_value = state.get("firmwareVersion")
-        elif key == "last_connect":
-            last_connect = state.get("lastConnect")
-            if last_connect:
-                from datetime import datetime, timezone
-
-                try:
-                    if isinstance(last_connect, str):
-                        # Parse ISO string
-                        dt = datetime.fromisoformat(last_connect.replace("Z", "+00:00"))
-                        self._attr_native_value = dt
-                    else:
-                        # Convert timestamp to datetime
-                        dt = datetime.fromtimestamp(
-                            last_connect / 1000,
-                            tz=timezone.utc,  # noqa: UP017
-                        )
-                        self._attr_native_value = dt
-                except (ValueError, TypeError):
-                    self._attr_native_value = None
-            else:
-                self._attr_native_value = None
 
-        self.async_write_ha_state()
+        self._async_write_state_if_changed()
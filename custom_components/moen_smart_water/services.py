@@ -3,8 +3,11 @@
 from __future__ import annotations
 
 import logging
+from collections.abc import Iterator
 
+import aiohttp
 import voluptuous as vol
+from homeassistant.config_entries import ConfigEntryState
 from homeassistant.core import HomeAssistant, ServiceCall
 from homeassistant.helpers import config_validation as cv
 
@@ -12,6 +15,10 @@ from .coordinator import MoenDataUpdateCoordinator
 
 _LOGGER = logging.getLogger(__name__)
 
+# Failures a service call logs instead of raising; the API client reports
+# empty or malformed responses as aiohttp.ClientError too
+SERVICE_ERRORS = (aiohttp.ClientError, TimeoutError)
+
 # Service schemas
 DISPENSE_SERVICE_SCHEMA = vol.Schema(
     {
@@ -53,8 +60,40 @@ SET_FLOW_RATE_SERVICE_SCHEMA = vol.Schema(
 )
 
 
+def _loaded_coordinators(hass: HomeAssistant) -> Iterator[MoenDataUpdateCoordinator]:
+    """Yield the coordinator of every loaded config entry."""
+    for entry in hass.config_entries.async_entries("moen_smart_water"):
+        if entry.state is ConfigEntryState.LOADED and isinstance(
+            entry.runtime_data, MoenDataUpdateCoordinator
+        ):
+            yield entry.runtime_data
+
+
+def _find_coordinator(
+    hass: HomeAssistant, device_id: str
+) -> MoenDataUpdateCoordinator | None:
+    """Find the coordinator that manages a device, logging if there is none.
+
+    This scans the loaded entries in turn. There are only ever a few, and each
+    check is a lookup in that coordinator's device map.
+    """
+    for coordinator in _loaded_coordinators(hass):
+        if device_id in coordinator.get_all_devices():
+            return coordinator
+
+    _LOGGER.error(
+        "Device %s not found in any configured Moen Smart Water integration",
+        device_id,
+    )
+    return None
+
+
 async def async_setup_services(hass: HomeAssistant) -> None:
     """Set up the services for Moen Smart Water integration."""
+    # Services are shared by all config entries; register them only once
+    if hass.services.has_service("moen_smart_water", "dispense_water"):
+        return
+
     _LOGGER.info("Setting up Moen Smart Water services")
 
     async def dispense_water(call: ServiceCall) -> None:
@@ -64,60 +103,32 @@ async def async_setup_services(hass: HomeAssistant) -> None:
         # call.data["volume_ml"]
         # call.data["timeout"]
 
-        # Find the coordinator for this device
-        coordinator = None
-        for _entry_id, entry_coordinator in hass.data.get(
-            "moen_smart_water", {}
-        ).items():
-            if isinstance(entry_coordinator, MoenDataUpdateCoordinator):
-                devices = entry_coordinator.get_all_devices()
-                if device_id in devices:
-                    coordinator = entry_coordinator
-                    break
-
+        coordinator = _find_coordinator(hass, device_id)
         if not coordinator:
-            _LOGGER.error(
-                "Device %s not found in any configured Moen Smart Water integration",
-                device_id,
-            )
             return
 
         try:
-            await hass.async_add_executor_job(
-                coordinator.api.start_water_flow, device_id, "coldest", 100
+            await coordinator.api.start_water_flow(device_id, "coldest", 100)
+            coordinator.async_set_reported_state(
+                device_id, {"state": "running", "flowRate": 100}
             )
             _LOGGER.info("Started dispensing from device %s", device_id)
-        except Exception as err:
+        except SERVICE_ERRORS as err:
             _LOGGER.error("Failed to dispense water from device %s: %s", device_id, err)
 
     async def stop_dispensing(call: ServiceCall) -> None:
         """Service to stop dispensing water from the faucet."""
         device_id = call.data["device_id"]
 
-        # Find the coordinator for this device
-        coordinator = None
-        for _entry_id, entry_coordinator in hass.data.get(
-            "moen_smart_water", {}
-        ).items():
-            if isinstance(entry_coordinator, MoenDataUpdateCoordinator):
-                devices = entry_coordinator.get_all_devices()
-                if device_id in devices:
-                    coordinator = entry_coordinator
-                    break
-
+        coordinator = _find_coordinator(hass, device_id)
         if not coordinator:
-            _LOGGER.error(
-                "Device %s not found in any configured Moen Smart Water integration",
-                device_id,
-            )
             return
 
         try:
-            await hass.async_add_executor_job(
-                coordinator.api.stop_water_flow, device_id
-            )
+            await coordinator.api.stop_water_flow(device_id)
+            coordinator.async_set_reported_state(device_id, {"state": "idle"})
             _LOGGER.info("Stopped dispensing from device %s", device_id)
-        except Exception as err:
+        except SERVICE_ERRORS as err:
             _LOGGER.error(
                 "Failed to stop dispensing from device %s: %s", device_id, err
             )
@@ -126,51 +137,27 @@ async def async_setup_services(hass: HomeAssistant) -> None:
         """Service to get device status."""
         device_id = call.data["device_id"]
 
-        # Find the coordinator for this device
-        coordinator = None
-        for _entry_id, entry_coordinator in hass.data.get(
-            "moen_smart_water", {}
-        ).items():
-            if isinstance(entry_coordinator, MoenDataUpdateCoordinator):
-                devices = entry_coordinator.get_all_devices()
-                if device_id in devices:
-                    coordinator = entry_coordinator
-                    break
-
+        coordinator = _find_coordinator(hass, device_id)
         if not coordinator:
-            _LOGGER.error(
-                "Device %s not found in any configured Moen Smart Water integration",
-                device_id,
-            )
             return
 
-        try:
-            shadow = coordinator.get_device_shadow(device_id)
-            _LOGGER.info("Device %s shadow: %s", device_id, shadow)
-        except Exception as err:
-            _LOGGER.error("Failed to get status for device %s: %s", device_id, err)
+        # Served from the last poll, no API call involved
+        shadow = coordinator.get_device_shadow(device_id)
+        _LOGGER.info("Device %s shadow: %s", device_id, shadow)
 
     async def get_user_profile(call: ServiceCall) -> None:
         """Service to get user profile."""
         # Find any coordinator (they all have the same user profile)
-        coordinator = None
-        for _entry_id, entry_coordinator in hass.data.get(
-            "moen_smart_water", {}
-        ).items():
-            if isinstance(entry_coordinator, MoenDataUpdateCoordinator):
-                coordinator = entry_coordinator
-                break
+        coordinator = next(_loaded_coordinators(hass), None)
 
         if not coordinator:
             _LOGGER.error("No Moen Smart Water integration found")
             return
 
         try:
-            profile = await hass.async_add_executor_job(
-                coordinator.api.get_user_profile
-            )
+            profile = await coordinator.api.get_user_profile()
             _LOGGER.info("User profile: %s", profile)
-        except Exception as err:
+        except SERVICE_ERRORS as err:
             _LOGGER.error("Failed to get user profile: %s", err)
 
     async def set_temperature(call: ServiceCall) -> None:
@@ -179,35 +166,24 @@ async def async_setup_services(hass: HomeAssistant) -> None:
         temperature = call.data["temperature"]
         flow_rate = call.data["flow_rate"]
 
-        # Find the coordinator for this device
-        coordinator = None
-        for _entry_id, entry_coordinator in hass.data.get(
-            "moen_smart_water", {}
-        ).items():
-            if isinstance(entry_coordinator, MoenDataUpdateCoordinator):
-                devices = entry_coordinator.get_all_devices()
-                if device_id in devices:
-                    coordinator = entry_coordinator
-                    break
-
+        coordinator = _find_coordinator(hass, device_id)
         if not coordinator:
-            _LOGGER.error(
-                "Device %s not found in any configured Moen Smart Water integration",
-                device_id,
-            )
             return
 
         try:
-            await hass.async_add_executor_job(
-                coordinator.api.set_specific_temperature,
+            await coordinator.api.set_specific_temperature(
                 device_id,
                 temperature,
                 flow_rate,
             )
+            coordinator.async_set_reported_state(
+                device_id,
+                {"state": "running", "temperature": temperature, "flowRate": flow_rate},
+            )
             _LOGGER.info(
                 "Set temperature to %.1f°C for device %s", temperature, device_id
             )
-        except Exception as err:
+        except SERVICE_ERRORS as err:
             _LOGGER.error("Failed to set temperature for device %s: %s", device_id, err)
 
     async def set_flow_rate(call: ServiceCall) -> None:
@@ -215,30 +191,14 @@ async def async_setup_services(hass: HomeAssistant) -> None:
         device_id = call.data["device_id"]
         flow_rate = call.data["flow_rate"]
 
-        # Find the coordinator for this device
-        coordinator = None
-        for _entry_id, entry_coordinator in hass.data.get(
-            "moen_smart_water", {}
-        ).items():
-            if isinstance(entry_coordinator, MoenDataUpdateCoordinator):
-                devices = entry_coordinator.get_all_devices()
-                if device_id in devices:
-                    coordinator = entry_coordinator
-                    break
-
+        coordinator = _find_coordinator(hass, device_id)
         if not coordinator:
-            _LOGGER.error(
-                "Device %s not found in any configured Moen Smart Water integration",
-                device_id,
-            )
             return
 
         try:
-            await hass.async_add_executor_job(
-                coordinator.api.set_flow_rate, device_id, flow_rate
-            )
+            await coordinator.api.set_flow_rate(device_id, flow_rate)
             _LOGGER.info("Set flow rate to %d%% for device %s", flow_rate, device_id)
-        except Exception as err:
+        except SERVICE_ERRORS as err:
             _LOGGER.error("Failed to set flow rate for device %s: %s", device_id, err)
 
     # Register services
@@ -12,7 +12,6 @@ from homeassistant.components.valve import (
 )
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
-from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
@@ -20,6 +19,8 @@ from .coordinator import MoenDataUpdateCoordinator
 
 _LOGGER = logging.getLogger(__name__)
 
+# Temperature presets supported by the faucet
+PRESET_MODES: list[str] = ["coldest", "cold", "warm", "hot", "hottest"]
 
 VALVE_DESCRIPTIONS: list[ValveEntityDescription] = [
     ValveEntityDescription(
@@ -37,27 +38,27 @@ async def async_setup_entry(
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up Moen Smart Water valve entities."""
-    coordinator: MoenDataUpdateCoordinator = hass.data["moen_smart_water"][
-        config_entry.entry_id
-    ]
+    coordinator: MoenDataUpdateCoordinator = config_entry.runtime_data
 
     # Get devices and create entities for each
     devices = coordinator.get_all_devices()
-    _LOGGER.info(
-        "Setting up valve entities. Found %d devices: %s",
-        len(devices),
-        list(devices.keys()),
-    )
-
-    entities = []
-    for device_id, device in devices.items():
-        device_name = device.get("name", f"Moen Smart Water {device_id}")
-        _LOGGER.info("Creating valve entity for device %s: %s", device_id, device_name)
-
-        for description in VALVE_DESCRIPTIONS:
-            entities.append(
-                MoenFaucetValve(coordinator, device_id, device_name, description)
-            )
+    if _LOGGER.isEnabledFor(logging.INFO):
+        _LOGGER.info(
+            "Setting up valve entities. Found %d devices: %s",
+            len(devices),
+            list(devices),
+        )
+
+    entities = [
+        MoenFaucetValve(
+            coordinator,
+            device_id,
+            device.get("name", f"Moen Smart Water {device_id}"),
+            description,
+        )
+        for device_id, device in devices.items()
+        for description in VALVE_DESCRIPTIONS
+    ]
 
     _LOGGER.info("Adding %d valve entities", len(entities))
     async_add_entities(entities)
@@ -101,19 +102,12 @@ class MoenFaucetValve(CoordinatorEntity, ValveEntity):
         self._attr_extra_state_attributes = {}
 
         # Device information
-        self._attr_device_info = DeviceInfo(
-            identifiers={("moen_smart_water", device_id)},
-            name=device_name,
-            manufacturer="Moen",
-            model="Smart Faucet",
-        )
+        self._attr_device_info = coordinator.get_device_info(device_id)
 
     def _handle_coordinator_update(self) -> None:
         """Handle updated data from the coordinator."""
-        shadow = self.coordinator.get_device_shadow(self._device_id)
-        if shadow:
-            state = shadow.get("state", {}).get("reported", {})
-
+        state = self.coordinator.get_reported_state(self._device_id)
+        if state is not None:
             # Update valve state based on device state and flow rate
             device_state = state.get("state", "idle")
             flow_rate = state.get("flowRate")
@@ -177,27 +171,23 @@ class MoenFaucetValve(CoordinatorEntity, ValveEntity):
             )
             # Use appropriate temperature method based on preset mode, like the buttons do
             if self._attr_preset_mode == "coldest":
-                await self.hass.async_add_executor_job(
-                    self.coordinator.api.set_coldest,
+                await self.coordinator.api.set_coldest(
                     self._device_id,
                     flow_rate,
                 )
             elif self._attr_preset_mode == "warm":
-                await self.hass.async_add_executor_job(
-                    self.coordinator.api.set_warm,
+                await self.coordinator.api.set_warm(
                     self._device_id,
                     flow_rate,
                 )
             elif self._attr_preset_mode == "hottest":
-                await self.hass.async_add_executor_job(
-                    self.coordinator.api.set_hottest,
+                await self.coordinator.api.set_hottest(
                     self._device_id,
                     flow_rate,
                 )
             else:
                 # Default to coldest if preset mode is not recognized
-                await self.hass.async_add_executor_job(
-                    self.coordinator.api.set_coldest,
+                await self.coordinator.api.set_coldest(
                     self._device_id,
                     flow_rate,
                 )
@@ -228,9 +218,7 @@ class MoenFaucetValve(CoordinatorEntity, ValveEntity):
             _LOGGER.info("Closing valve for device %s", self._device_id)
 
             # Call the API to stop water flow
-            await self.hass.async_add_executor_job(
-                self.coordinator.api.stop_water_flow, self._device_id
-            )
+            await self.coordinator.api.stop_water_flow(self._device_id)
 
             # Immediately update valve state to closed
             self._attr_is_closed = True
@@ -277,9 +265,7 @@ class MoenFaucetValve(CoordinatorEntity, ValveEntity):
                 if not self._attr_is_closed:
                     _LOGGER.info("Position set to 0%, closing valve")
                     # Call stop_water_flow directly like the stop button does
-                    await self.hass.async_add_executor_job(
-                        self.coordinator.api.stop_water_flow, self._device_id
-                    )
+                    await self.coordinator.api.stop_water_flow(self._device_id)
                     # Immediately update valve state to closed
                     self._attr_is_closed = True
                     self._attr_is_opening = False
@@ -300,8 +286,7 @@ class MoenFaucetValve(CoordinatorEntity, ValveEntity):
                 )
 
                 # Start water flow with current temperature preset and new flow rate
-                await self.hass.async_add_executor_job(
-                    self.coordinator.api.start_water_flow,
+                await self.coordinator.api.start_water_flow(
                     self._device_id,
                     self._attr_preset_mode,
                     int(position),
@@ -329,8 +314,7 @@ class MoenFaucetValve(CoordinatorEntity, ValveEntity):
     async def async_set_temperature(self, temperature: float) -> None:
         """Set the water temperature."""
         try:
-            await self.hass.async_add_executor_job(
-                self.coordinator.api.set_specific_temperature,
+            await self.coordinator.api.set_specific_temperature(
                 self._device_id,
                 temperature,
                 int(self._attr_valve_position),
@@ -349,20 +333,17 @@ class MoenFaucetValve(CoordinatorEntity, ValveEntity):
         try:
             # Map preset modes to API calls
             if preset_mode == "coldest":
-                await self.hass.async_add_executor_job(
-                    self.coordinator.api.set_coldest,
+                await self.coordinator.api.set_coldest(
                     self._device_id,
                     int(self._attr_valve_position),
                 )
             elif preset_mode == "hottest":
-                await self.hass.async_add_executor_job(
-                    self.coordinator.api.set_hottest,
+                await self.coordinator.api.set_hottest(
                     self._device_id,
                     int(self._attr_valve_position),
                 )
             elif preset_mode == "warm":
-                await self.hass.async_add_executor_job(
-                    self.coordinator.api.set_warm,
+                await self.coordinator.api.set_warm(
                     self._device_id,
                     int(self._attr_valve_position),
                 )
@@ -379,7 +360,7 @@ class MoenFaucetValve(CoordinatorEntity, ValveEntity):
     @property
     def preset_modes(self) -> list[str]:
         """Return the available preset modes."""
-        return ["coldest", "cold", "warm", "hot", "hottest"]
+        return PRESET_MODES
 
     @property
     def current_option(self) -> str:
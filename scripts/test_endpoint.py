@@ -9,16 +9,19 @@ Usage:
     python test_endpoint.py "set_coldest('101046568')"
 """
 
+import asyncio
 import sys
 from pathlib import Path
 
+import aiohttp
+
 # Add the scripts directory to the path
 sys.path.insert(0, str(Path(__file__).parent))
 
 from moen_api_standalone import MoenAPI
 
 
-def main():
+async def async_main(session: aiohttp.ClientSession) -> None:
     """Test a specific endpoint."""
     if len(sys.argv) != 2:
         print('Usage: python test_endpoint.py "method_name(args)"')
@@ -33,7 +36,7 @@ def main():
 
     # Initialize API (will prompt for credentials if needed)
     print("Initializing Moen API...")
-    api = MoenAPI("", "")  # Will be set by credentials loading
+    api = MoenAPI(session, "", "")  # Will be set by credentials loading
 
     # Load credentials
     credentials_file = Path(__file__).parent / "moen_credentials.json"
@@ -45,23 +48,23 @@ def main():
 
         if "access_token" in creds:
             # Use stored tokens
-            api.access_token = creds["access_token"]
-            api.id_token = creds.get("id_token")
-            api.refresh_token = creds.get("refresh_token")
-            api.token_expiry = creds.get("expires_at", 0)
-
-            if api.access_token:
-                api.session.headers.update(
-                    {"Authorization": f"Bearer {api.access_token}"}
-                )
+            api = MoenAPI(
+                session,
+                "",
+                "",
+                tokens={
+                    "access_token": creds["access_token"],
+                    "id_token": creds.get("id_token"),
+                    "refresh_token": creds.get("refresh_token"),
+                    "token_expiry": creds.get("expires_at", 0),
+                },
+            )
 
             # Check if token needs refresh
-            import time
-
-            if time.time() > api.token_expiry:
+            if not api.has_valid_token():
                 if api.refresh_token:
                     print("Token expired, attempting refresh...")
-                    if api._refresh_access_token():
+                    if await api._refresh_access_token():
                         print("✓ Token refreshed successfully")
                         # Save refreshed tokens
                         import json
@@ -96,7 +99,7 @@ def main():
 
     try:
         # Use eval to execute the method call (safe in this context)
-        result = eval(f"api.{method_call}")
+        result = await eval(f"api.{method_call}")
         print("✓ Success!")
         print(f"Result: {result}")
     except Exception as e:
@@ -104,5 +107,16 @@ def main():
         sys.exit(1)
 
 
+async def main_async() -> None:
+    """Run the endpoint test with a managed aiohttp session."""
+    async with aiohttp.ClientSession() as session:
+        await async_main(session)
+
+
+def main():
+    """Entry point."""
+    asyncio.run(main_async())
+
+
 if __name__ == "__main__":
     main()
@@ -12,14 +12,16 @@ Usage:
 """
 
 import argparse
+import asyncio
 import json
 
 # Import the standalone API class
 import sys
-import time
 from pathlib import Path
 from typing import Any
 
+import aiohttp
+
 sys.path.append(str(Path(__file__).parent))
 from moen_api_standalone import CLIENT_ID, MoenAPI
 
@@ -31,6 +33,7 @@ class MoenAPITester:
         """Initialize the tester."""
         self.credentials_file = Path(__file__).parent / "moen_credentials.json"
         self.api: MoenAPI | None = None
+        self.session: aiohttp.ClientSession | None = None
 
     def load_credentials(self) -> dict[str, str] | None:
         """Load credentials from file if it exists."""
@@ -96,25 +99,22 @@ class MoenAPITester:
             if "access_token" in credentials:
                 # Initialize API with tokens
                 self.api = MoenAPI(
+                    session=self.session,
                     username="",  # Not needed when using tokens
                     password="",  # Not needed when using tokens
+                    tokens={
+                        "access_token": credentials["access_token"],
+                        "id_token": credentials.get("id_token"),
+                        "refresh_token": credentials.get("refresh_token"),
+                        "token_expiry": credentials.get("expires_at", 0),
+                    },
                 )
-                # Set the tokens directly
-                self.api.access_token = credentials["access_token"]
-                self.api.id_token = credentials.get("id_token")
-                self.api.refresh_token = credentials.get("refresh_token")
-                self.api.token_expiry = credentials.get("expires_at", 0)
-
-                # Update session headers
-                if self.api.access_token:
-                    self.api.session.headers.update(
-                        {"Authorization": f"Bearer {self.api.access_token}"}
-                    )
 
                 print("✓ Using stored OAuth tokens")
             else:
                 # Initialize API with username/password for authentication
                 self.api = MoenAPI(
+                    session=self.session,
                     username=credentials["username"],
                     password=credentials["password"],
                 )
@@ -125,15 +125,15 @@ class MoenAPITester:
             print(f"Error initializing API: {e}")
             return False
 
-    def test_authentication(self) -> bool:
+    async def test_authentication(self) -> bool:
         """Test authentication."""
         print("\n=== Testing Authentication ===")
         try:
             # Check if we need to refresh or login
-            if not self.api.access_token or time.time() > self.api.token_expiry:
+            if not self.api.has_valid_token():
                 if self.api.refresh_token:
                     print("Attempting to refresh access token...")
-                    if self.api._refresh_access_token():
+                    if await self.api._refresh_access_token():
                         print("✓ Token refreshed successfully")
 
                         # Save refreshed tokens
@@ -147,7 +147,7 @@ class MoenAPITester:
                         print("✓ Refreshed tokens saved for future use")
                     else:
                         print("Refresh failed, logging in with username/password...")
-                        login_result = self.api.login()
+                        login_result = await self.api.login()
                         print("✓ Authentication successful")
 
                         # Save tokens for future use
@@ -166,7 +166,7 @@ class MoenAPITester:
                     print(
                         "No refresh token available, logging in with username/password..."
                     )
-                    login_result = self.api.login()
+                    login_result = await self.api.login()
                     print("✓ Authentication successful")
 
                     # Save tokens for future use
@@ -189,11 +189,11 @@ class MoenAPITester:
             print(f"✗ Authentication failed: {e}")
             return False
 
-    def test_user_profile(self) -> bool:
+    async def test_user_profile(self) -> bool:
         """Test getting user profile."""
         print("\n=== Testing User Profile ===")
         try:
-            profile = self.api.get_user_profile()
+            profile = await self.api.get_user_profile()
             print(f"✓ User profile retrieved for: {profile.get('email', 'unknown')}")
             print(
                 f"  Name: {profile.get('firstName', '')} {profile.get('lastName', '')}"
@@ -204,11 +204,11 @@ class MoenAPITester:
             print(f"✗ Failed to get user profile: {e}")
             return False
 
-    def test_locations(self) -> bool:
+    async def test_locations(self) -> bool:
         """Test getting locations."""
         print("\n=== Testing Locations ===")
         try:
-            locations = self.api.get_locations()
+            locations = await self.api.get_locations()
             print(f"✓ Retrieved {len(locations)} locations")
             for location in locations:
                 print(
@@ -223,11 +223,11 @@ class MoenAPITester:
             print(f"✗ Failed to get locations: {e}")
             return False
 
-    def test_devices(self) -> bool:
+    async def test_devices(self) -> bool:
         """Test getting devices."""
         print("\n=== Testing Devices ===")
         try:
-            devices = self.api.list_devices()
+            devices = await self.api.list_devices()
             print(f"✓ Retrieved {len(devices)} VAK devices")
             for device in devices:
                 print(
@@ -243,11 +243,11 @@ class MoenAPITester:
             print(f"✗ Failed to get devices: {e}")
             return False
 
-    def test_temperature_definitions(self) -> bool:
+    async def test_temperature_definitions(self) -> bool:
         """Test getting temperature definitions."""
         print("\n=== Testing Temperature Definitions ===")
         try:
-            user_details = self.api.get_user_details_and_temperature_definitions()
+            user_details = await self.api.get_user_details_and_temperature_definitions()
             temp_defs = user_details.get("temperatureDefinitions", {})
             print("✓ Retrieved temperature definitions:")
             for key, value in temp_defs.items():
@@ -257,11 +257,11 @@ class MoenAPITester:
             print(f"✗ Failed to get temperature definitions: {e}")
             return False
 
-    def test_device_shadow(self, client_id: str) -> bool:
+    async def test_device_shadow(self, client_id: str) -> bool:
         """Test getting device shadow with all available data."""
         print(f"\n=== Testing Device Shadow for {client_id} ===")
         try:
-            shadow = self.api.get_device_shadow(client_id)
+            shadow = await self.api.get_device_shadow(client_id)
             state = shadow.get("state", {})
             reported = state.get("reported", {})
             desired = state.get("desired", {})
@@ -349,14 +349,14 @@ class MoenAPITester:
             print(f"✗ Failed to get device shadow: {e}")
             return False
 
-    def test_water_control(self, client_id: str) -> bool:
+    async def test_water_control(self, client_id: str) -> bool:
         """Test water control functions."""
         print(f"\n=== Testing Water Control for {client_id} ===")
 
         try:
             # Test getting current state
             print("Getting current device state...")
-            shadow = self.api.get_device_shadow(client_id)
+            shadow = await self.api.get_device_shadow(client_id)
             current_state = (
                 shadow.get("state", {}).get("reported", {}).get("state", "unknown")
             )
@@ -364,23 +364,21 @@ class MoenAPITester:
 
             # Test stopping water (in case it's running)
             print("Stopping water flow...")
-            result = self.api.stop_water_flow(client_id)
+            result = await self.api.stop_water_flow(client_id)
             print(f"Stop result: {result}")
 
             # Test setting coldest temperature
             print("Setting coldest temperature...")
-            result = self.api.set_coldest(client_id)
+            result = await self.api.set_coldest(client_id)
             print(f"Coldest result: {result}")
 
             # Wait a moment
-            import time
-
             print("Waiting 3 seconds...")
-            time.sleep(3)
+            await asyncio.sleep(3)
 
             # Test stopping again
             print("Stopping water flow...")
-            result = self.api.stop_water_flow(client_id)
+            result = await self.api.stop_water_flow(client_id)
             print(f"Stop result: {result}")
 
             print("✓ Water control test completed")
@@ -390,11 +388,11 @@ class MoenAPITester:
             print(f"✗ Water control test failed: {e}")
             return False
 
-    def test_usage_data(self, client_id: str) -> bool:
+    async def test_usage_data(self, client_id: str) -> bool:
         """Test getting usage data."""
         print(f"\n=== Testing Usage Data for {client_id} ===")
         try:
-            usage = self.api.get_daily_usage(client_id)
+            usage = await self.api.get_daily_usage(client_id)
             current = usage.get("current", {})
             total_usage = current.get("total", 0)
             print(f"✓ Daily usage retrieved: {total_usage} μL total")
@@ -411,17 +409,25 @@ class MoenAPITester:
             print(f"✗ Failed to get usage data: {e}")
             return False
 
-    def run_tests(self, test_type: str = "all") -> None:
+    async def run_tests(self, test_type: str = "all") -> None:
         """Run specified API tests."""
         print("Moen Smart Faucet API Tester")
         print("=" * 40)
 
+        self.session = aiohttp.ClientSession()
+        try:
+            await self._run_tests(test_type)
+        finally:
+            await self.session.close()
+
+    async def _run_tests(self, test_type: str) -> None:
+        """Run the selected tests with an open session."""
         if not self.initialize_api():
             print("Failed to initialize API. Exiting.")
             return
 
         # Test authentication
-        if not self.test_authentication():
+        if not await self.test_authentication():
             print("Authentication failed. Exiting.")
             return
 
@@ -432,21 +438,21 @@ class MoenAPITester:
 
         # Test basic API calls
         if test_type in ["all", "basic", "devices"]:
-            self.test_user_profile()
-            self.test_locations()
-            self.test_devices()
-            self.test_temperature_definitions()
+            await self.test_user_profile()
+            await self.test_locations()
+            await self.test_devices()
+            await self.test_temperature_definitions()
 
         # Test device-specific endpoints
         if test_type in ["all", "devices", "water-control"]:
-            devices = self.api.get_cached_devices()
+            devices = await self.api.get_cached_devices()
             if devices:
                 device = devices[0]  # Use first device
                 client_id = device.get("clientId")
 
                 if client_id:
-                    self.test_device_shadow(client_id)
-                    self.test_usage_data(client_id)
+                    await self.test_device_shadow(client_id)
+                    await self.test_usage_data(client_id)
 
                     if test_type in ["all", "water-control"]:
                         # Ask user if they want to test water control
@@ -458,7 +464,7 @@ class MoenAPITester:
                             .strip()
                         )
                         if test_water == "y":
-                            self.test_water_control(client_id)
+                            await self.test_water_control(client_id)
                 else:
                     print("No client ID found for device testing")
             else:
@@ -553,7 +559,7 @@ Examples:
         test_type = "all"
 
     tester = MoenAPITester()
-    tester.run_tests(test_type)
+    asyncio.run(tester.run_tests(test_type))
 
 
 if __name__ == "__main__":
@@ -2,6 +2,15 @@
 
 from __future__ import annotations
 
+import asyncio
+import inspect
+import time
+from unittest.mock import AsyncMock, MagicMock
+
+import aiohttp
+import pytest
+
+from custom_components.moen_smart_water import api as api_module
 from custom_components.moen_smart_water.api import MoenAPI
 
 
@@ -10,7 +19,7 @@ class TestAPIStructure:
 
     def test_api_init(self):
         """Test API initialization."""
-        api = MoenAPI("test@example.com", "password")
+        api = MoenAPI(MagicMock(), "test@example.com", "password")
 
         assert api.username == "test@example.com"
         assert api.password == "password"
@@ -18,25 +27,231 @@ class TestAPIStructure:
         assert api.access_token is None
         assert api.refresh_token is None
 
-    def test_api_session_headers(self):
-        """Test API session headers are set correctly."""
-        api = MoenAPI("test@example.com", "password")
+    def test_api_request_headers(self):
+        """Test API request headers are set correctly."""
+        api = MoenAPI(MagicMock(), "test@example.com", "password")
+
+        assert "User-Agent" in api.headers
+        assert api.headers["User-Agent"] == "Smartwater-iOS-prod-3.39.0"
+        assert "Authorization" not in api.headers
+
+    def test_api_uses_provided_session(self):
+        """Test API keeps the caller-provided aiohttp session."""
+        session = MagicMock()
+        api = MoenAPI(session, "test@example.com", "password")
 
-        assert "User-Agent" in api.session.headers
-        assert api.session.headers["User-Agent"] == "Smartwater-iOS-prod-3.39.0"
+        assert api.session is session
 
     def test_api_cached_data_initialization(self):
         """Test API cached data is initialized correctly."""
-        api = MoenAPI("test@example.com", "password")
+        api = MoenAPI(MagicMock(), "test@example.com", "password")
 
         assert api._user_profile is None
         assert api._locations is None
         assert api._devices is None
         assert api._temperature_definitions is None
 
+    def test_api_invalidate_devices(self):
+        """Test the cached device list can be invalidated."""
+        api = MoenAPI(MagicMock(), "test@example.com", "password")
+        api._devices = [{"clientId": "123"}]
+
+        api.invalidate_devices()
+
+        assert api._devices is None
+
+    @pytest.mark.asyncio
+    async def test_api_shadow_cache(self):
+        """Test recent device shadows are served from cache until invalidated."""
+        api = MoenAPI(MagicMock(), "test@example.com", "password")
+        shadow = {"state": {"reported": {"state": "idle"}}}
+        api._shadow_cache["123"] = (time.monotonic(), shadow)
+
+        assert await api.get_device_shadow("123") is shadow
+
+        api.invalidate_shadow("123")
+
+        assert "123" not in api._shadow_cache
+
+    @pytest.mark.asyncio
+    async def test_api_update_shadow_invalidates_after_command(self):
+        """Test a shadow cached while a command is in flight is dropped."""
+        api = MoenAPI(MagicMock(), "test@example.com", "password")
+        api._ensure_auth = AsyncMock()
+        stale = {"state": {"reported": {"state": "idle"}}}
+
+        async def post(url, payload, *, idempotent=True):
+            # A concurrent poll caches the pre-command shadow
+            api._shadow_cache["123"] = (time.monotonic(), stale)
+            raise aiohttp.ClientError("boom")
+
+        api._post_with_retry = post
+
+        with pytest.raises(aiohttp.ClientError):
+            await api.update_device_shadow("123", {"command": "stop"})
+        assert "123" not in api._shadow_cache
+
+    @pytest.mark.asyncio
+    async def test_api_shadow_requests_coalesced(self):
+        """Test concurrent shadow reads share a single API request."""
+        api = MoenAPI(MagicMock(), "test@example.com", "password")
+        shadow = {"state": {"reported": {"state": "idle"}}}
+        calls = 0
+
+        async def fetch(client_id):
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0)
+            return shadow
+
+        api._fetch_device_shadow = fetch
+
+        results = await asyncio.gather(
+            api.get_device_shadow("123"), api.get_device_shadow("123")
+        )
+
+        assert results == [shadow, shadow]
+        assert calls == 1
+        assert api._shadow_requests == {}
+        assert api._shadow_cache["123"][1] is shadow
+
+    @pytest.mark.asyncio
+    async def test_api_ensure_auth_single_flight(self):
+        """Test concurrent callers trigger only one token refresh."""
+        api = MoenAPI(MagicMock(), "test@example.com", "password")
+        api.refresh_token = "refresh"
+        calls = 0
+
+        async def refresh():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0)
+            api.access_token = "token"
+            api._set_token_expiry(3600)
+            return True
+
+        api._refresh_access_token = refresh
+
+        await asyncio.gather(*(api._ensure_auth() for _ in range(5)))
+
+        assert calls == 1
+
+    @pytest.mark.asyncio
+    async def test_api_ensure_auth_logs_in_without_refresh_token(self):
+        """Test a missing refresh token falls through to a full login."""
+        api = MoenAPI(MagicMock(), "test@example.com", "password")
+
+        async def login():
+            api.access_token = "token"
+            api._set_token_expiry(3600)
+            return {}
+
+        api.login = AsyncMock(side_effect=login)
+
+        await api._ensure_auth()
+
+        api.login.assert_awaited_once()
+        assert api.has_valid_token()
+
+    def test_api_restored_token_validity(self):
+        """Test restored tokens are validated against their stored expiry."""
+        session = MagicMock()
+        valid = MoenAPI(
+            session,
+            "test@example.com",
+            "password",
+            tokens={"access_token": "token", "token_expiry": time.time() + 600},
+        )
+        expired = MoenAPI(
+            session,
+            "test@example.com",
+            "password",
+            tokens={"access_token": "token", "token_expiry": time.time() - 600},
+        )
+
+        assert valid.has_valid_token()
+        assert valid.headers["Authorization"] == "Bearer token"
+        assert not expired.has_valid_token()
+        assert "Authorization" not in expired.headers
+
+    @pytest.mark.asyncio
+    async def test_api_stale_devices_refreshed_in_background(self):
+        """Test a stale device list is served while it is refreshed."""
+        api = MoenAPI(MagicMock(), "test@example.com", "password")
+        stale = [{"clientId": "123"}]
+        fresh = [{"clientId": "123"}, {"clientId": "456"}]
+        api._devices = stale
+        api._devices_fetched_at = time.monotonic() - api_module.DEVICE_LIST_TTL - 1
+
+        async def list_devices():
+            api._devices = fresh
+            api._devices_fetched_at = time.monotonic()
+            return fresh
+
+        api.list_devices = list_devices
+
+        assert await api.get_cached_devices() is stale
+        await api._devices_refresh
+        assert await api.get_cached_devices() is fresh
+
+    @pytest.mark.asyncio
+    async def test_api_background_refresh_failure_contained(self):
+        """Test any background refresh failure is logged, not raised."""
+        api = MoenAPI(MagicMock(), "test@example.com", "password")
+        api.list_devices = AsyncMock(side_effect=ValueError("bad body"))
+
+        await api._refresh_devices()
+
+    @pytest.mark.asyncio
+    async def test_api_close_cancels_background_refresh(self):
+        """Test closing the client cancels a pending device list refresh."""
+        api = MoenAPI(MagicMock(), "test@example.com", "password")
+        api._devices = [{"clientId": "123"}]
+        api._devices_fetched_at = time.monotonic() - api_module.DEVICE_LIST_TTL - 1
+
+        async def list_devices():
+            await asyncio.sleep(3600)
+
+        api.list_devices = list_devices
+
+        await api.get_cached_devices()
+        refresh = api._devices_refresh
+        api.close()
+
+        with pytest.raises(asyncio.CancelledError):
+            await refresh
+        assert api._devices_refresh is None
+
+    @pytest.mark.asyncio
+    async def test_api_get_device_shadows_skips_failures(self):
+        """Test batch shadow fetch keeps successes and drops failures."""
+        api = MoenAPI(MagicMock(), "test@example.com", "password")
+        shadow = {"state": {"reported": {"state": "idle"}}}
+
+        async def get_device_shadow(client_id):
+            if client_id == "bad":
+                raise aiohttp.ClientError("boom")
+            return shadow
+
+        api.get_device_shadow = get_device_shadow
+
+        assert await api.get_device_shadows(["good", "bad"]) == {"good": shadow}
+
+    @pytest.mark.asyncio
+    async def test_api_get_device_shadows_logs_failure_once(self, caplog):
+        """Test a failed shadow fetch is logged once, as a warning."""
+        api = MoenAPI(MagicMock(), "test@example.com", "password")
+        api._ensure_auth = AsyncMock()
+        api._post_with_retry = AsyncMock(side_effect=aiohttp.ClientError("offline"))
+
+        assert await api.get_device_shadows(["bad"]) == {}
+
+        failures = [r for r in caplog.records if "offline" in r.getMessage()]
+        assert [r.levelname for r in failures] == ["WARNING"]
+
     def test_api_methods_exist(self):
         """Test that API methods exist."""
-        api = MoenAPI("test@example.com", "password")
+        api = MoenAPI(MagicMock(), "test@example.com", "password")
 
         # Check that key methods exist
         assert hasattr(api, "login")
@@ -47,3 +262,250 @@ class TestAPIStructure:
         assert hasattr(api, "stop_water_flow")
         assert hasattr(api, "set_specific_temperature")
         assert hasattr(api, "set_flow_rate")
+
+    def test_api_methods_are_coroutines(self):
+        """Test that network-bound API methods are async."""
+        for name in (
+            "login",
+            "get_user_profile",
+            "list_devices",
+            "get_device_shadow",
+            "update_device_shadow",
+            "start_water_flow",
+            "stop_water_flow",
+            "get_cached_devices",
+        ):
+            assert inspect.iscoroutinefunction(getattr(MoenAPI, name)), name
+
+
+class _FakeResponse:
+    """Minimal aiohttp response stand-in."""
+
+    def __init__(self, status: int, data: dict) -> None:
+        self.status = status
+        self._data = data
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return False
+
+    def raise_for_status(self) -> None:
+        if self.status >= 400:
+            raise aiohttp.ClientResponseError(
+                MagicMock(), (), status=self.status, message="error"
+            )
+
+    async def json(self, **kwargs):
+        return self._data
+
+
+class TestAPIRetry:
+    """Test cases for transient failure retries."""
+
+    @pytest.mark.asyncio
+    async def test_retries_transient_status(self, monkeypatch):
+        """Test a 503 is retried and the next success returned."""
+        monkeypatch.setattr(api_module, "RETRY_BASE_DELAY", 0)
+        session = MagicMock()
+        session.post.side_effect = [
+            _FakeResponse(503, {}),
+            _FakeResponse(200, {"StatusCode": 200}),
+        ]
+        api = MoenAPI(session, "test@example.com", "password")
+
+        assert await api._post_with_retry("https://example", {}) == {"StatusCode": 200}
+        assert session.post.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_does_not_retry_client_errors(self, monkeypatch):
+        """Test a 404 is raised without retrying."""
+        monkeypatch.setattr(api_module, "RETRY_BASE_DELAY", 0)
+        session = MagicMock()
+        session.post.side_effect = [_FakeResponse(404, {})]
+        api = MoenAPI(session, "test@example.com", "password")
+
+        with pytest.raises(aiohttp.ClientResponseError):
+            await api._post_with_retry("https://example", {})
+        assert session.post.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_does_not_retry_timed_out_command(self, monkeypatch):
+        """Test a command that timed out is not sent again."""
+        monkeypatch.setattr(api_module, "RETRY_BASE_DELAY", 0)
+        session = MagicMock()
+        session.post.side_effect = TimeoutError
+        api = MoenAPI(session, "test@example.com", "password")
+
+        with pytest.raises(TimeoutError):
+            await api._post_with_retry("https://example", {}, idempotent=False)
+        assert session.post.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_retries_throttled_command(self, monkeypatch):
+        """Test a command rejected with 429 is retried."""
+        monkeypatch.setattr(api_module, "RETRY_BASE_DELAY", 0)
+        session = MagicMock()
+        session.post.side_effect = [
+            _FakeResponse(429, {}),
+            _FakeResponse(200, {"StatusCode": 200}),
+        ]
+        api = MoenAPI(session, "test@example.com", "password")
+
+        assert await api._post_with_retry("https://example", {}, idempotent=False) == {
+            "StatusCode": 200
+        }
+        assert session.post.call_count == 2
+
+
+class TestAPITimeouts:
+    """Test cases for logging request timeouts."""
+
+    @pytest.mark.asyncio
+    async def test_shadow_timeout_logged_once(self, monkeypatch, caplog):
+        """Test a timed-out shadow fetch logs a single warning."""
+        monkeypatch.setattr(api_module, "RETRY_BASE_DELAY", 0)
+        session = MagicMock()
+        session.post.side_effect = TimeoutError
+        api = MoenAPI(session, "test@example.com", "password")
+        api._ensure_auth = AsyncMock()
+
+        assert await api.get_device_shadows(["123"]) == {}
+
+        assert [r.levelname for r in caplog.records if r.levelname != "DEBUG"] == [
+            "WARNING"
+        ]
+
+    @pytest.mark.asyncio
+    async def test_api_call_timeout_logged(self, caplog):
+        """Test a timeout in a decorated call is logged and re-raised."""
+        session = MagicMock()
+        session.post.side_effect = TimeoutError
+        api = MoenAPI(session, "test@example.com", "password")
+        api._ensure_auth = AsyncMock()
+
+        with pytest.raises(TimeoutError):
+            await api.get_user_details_and_temperature_definitions()
+
+        errors = [r for r in caplog.records if r.levelname == "ERROR"]
+        assert [r.getMessage() for r in errors] == ["Failed to get user details: "]
+
+    @pytest.mark.asyncio
+    async def test_login_timeout_logged(self, caplog):
+        """Test a login timeout is logged and re-raised."""
+        session = MagicMock()
+        session.post.side_effect = TimeoutError
+        api = MoenAPI(session, "test@example.com", "password")
+
+        with pytest.raises(TimeoutError):
+            await api.login()
+
+        errors = [r for r in caplog.records if r.levelname == "ERROR"]
+        assert [r.getMessage() for r in errors] == ["Login failed: "]
+
+
+class TestAPIResponses:
+    """Test cases for rejecting empty or malformed responses."""
+
+    @pytest.mark.asyncio
+    async def test_empty_body_is_client_error(self):
+        """Test an empty response body raises a client error."""
+        session = MagicMock()
+        session.post.side_effect = [_FakeResponse(200, None)]
+        api = MoenAPI(session, "test@example.com", "password")
+
+        with pytest.raises(api_module.MoenResponseError):
+            await api._post_with_retry("https://example", {})
+
+    @pytest.mark.asyncio
+    async def test_malformed_invoker_payload_is_client_error(self):
+        """Test an undecodable invoker Payload raises a client error."""
+        session = MagicMock()
+        session.post.side_effect = [
+            _FakeResponse(200, {"StatusCode": 200, "Payload": "not json"})
+        ]
+        api = MoenAPI(session, "test@example.com", "password")
+        api._ensure_auth = AsyncMock()
+
+        with pytest.raises(aiohttp.ClientError):
+            await api.update_device_shadow("123", {"command": "stop"})
+
+
+class TestAPIConcurrency:
+    """Test cases for bounding concurrent requests."""
+
+    @pytest.mark.asyncio
+    async def test_requests_bounded_by_max_concurrency(self):
+        """Test no more than max_concurrency requests run at once."""
+        in_flight = 0
+        peak = 0
+
+        class _SlowResponse(_FakeResponse):
+            async def __aenter__(self):
+                nonlocal in_flight, peak
+                in_flight += 1
+                peak = max(peak, in_flight)
+                await asyncio.sleep(0)
+                return self
+
+            async def __aexit__(self, *exc_info):
+                nonlocal in_flight
+                in_flight -= 1
+                return False
+
+        session = MagicMock()
+        session.post.side_effect = lambda *a, **kw: _SlowResponse(200, {})
+        api = MoenAPI(session, "test@example.com", "password", max_concurrency=2)
+
+        await asyncio.gather(
+            *(api._post_with_retry("https://example", {}) for _ in range(6))
+        )
+        assert session.post.call_count == 6
+        assert peak == 2
+
+
+class TestAPIReauth:
+    """Test cases for re-authenticating when a token is rejected."""
+
+    @staticmethod
+    def _api(session):
+        api = MoenAPI(session, "test@example.com", "password")
+        api.refresh_token = "refresh"
+        api.access_token = "stale"
+        api._set_token_expiry(3600)
+
+        async def refresh():
+            api.access_token = "fresh"
+            api._set_token_expiry(3600)
+            return True
+
+        api._refresh_access_token = refresh
+        return api
+
+    @pytest.mark.asyncio
+    async def test_reauths_once_on_401(self):
+        """Test a rejected token is refreshed and the call retried once."""
+        session = MagicMock()
+        session.get.side_effect = [
+            _FakeResponse(401, {}),
+            _FakeResponse(200, {"email": "test@example.com"}),
+        ]
+        api = self._api(session)
+
+        profile = await api.get_user_profile()
+
+        assert profile == {"email": "test@example.com"}
+        assert api.access_token == "fresh"
+        assert session.get.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_gives_up_after_second_401(self):
+        """Test a second rejection is raised instead of looping."""
+        session = MagicMock()
+        session.get.side_effect = [_FakeResponse(401, {}), _FakeResponse(401, {})]
+        api = self._api(session)
+
+        with pytest.raises(aiohttp.ClientResponseError):
+            await api.get_user_profile()
+        assert session.get.call_count == 2
@@ -0,0 +1,140 @@
+"""Tests for the Moen Smart Water data update coordinator."""
+
+from __future__ import annotations
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from custom_components.moen_smart_water.coordinator import (
+    ACTIVE_SCAN_INTERVAL,
+    SCAN_INTERVAL,
+    MoenDataUpdateCoordinator,
+    async_store_tokens,
+)
+
+DEVICE_ID = "test_device_123"
+
+
+def _shadow(state: str) -> dict:
+    """Return a device shadow reporting the given faucet state."""
+    return {"state": {"reported": {"state": state, "temperature": 25.0}}}
+
+
+@pytest.fixture
+def stub_api() -> MagicMock:
+    """Return a MoenAPI stand-in serving one idle device."""
+    api = MagicMock()
+    api.get_cached_devices = AsyncMock(return_value=[{"clientId": DEVICE_ID}])
+    api.get_device_shadows = AsyncMock(return_value={DEVICE_ID: _shadow("idle")})
+    api.get_tokens.return_value = {"access_token": "token"}
+    return api
+
+
+@pytest.fixture
+def stub_coordinator(stub_api: MagicMock) -> MoenDataUpdateCoordinator:
+    """Return a coordinator wired to the stub API."""
+    hass = MagicMock()
+    entry = MagicMock()
+    entry.data = {"tokens": {"access_token": "token"}}
+    return MoenDataUpdateCoordinator(hass, stub_api, entry)
+
+
+class TestReportedStateOverlay:
+    """Test cases for optimistic reported state updates."""
+
+    @pytest.mark.asyncio
+    async def test_overlay_updates_shadow_and_interval(
+        self, stub_api, stub_coordinator
+    ):
+        """Test an optimistic change reaches shadow readers and the interval."""
+        coordinator = stub_coordinator
+        api_shadow = stub_api.get_device_shadows.return_value[DEVICE_ID]
+        coordinator.data = await coordinator._async_update_data()
+        assert coordinator.update_interval == SCAN_INTERVAL
+
+        coordinator.async_set_reported_state(DEVICE_ID, {"state": "running"})
+
+        reported = coordinator.get_reported_state(DEVICE_ID)
+        assert reported == {"state": "running", "temperature": 25.0}
+        assert coordinator.get_device_shadow(DEVICE_ID)["state"]["reported"] is reported
+        assert coordinator.data["device_shadows"][DEVICE_ID]["state"]["reported"] == (
+            reported
+        )
+        assert coordinator.update_interval == ACTIVE_SCAN_INTERVAL
+        # The API's cached shadow is left untouched
+        assert api_shadow == _shadow("idle")
+
+    @pytest.mark.asyncio
+    async def test_overlay_ignores_unknown_device(self, stub_coordinator):
+        """Test a change for a device without a shadow is dropped."""
+        coordinator = stub_coordinator
+        coordinator.data = await coordinator._async_update_data()
+
+        coordinator.async_set_reported_state("other", {"state": "running"})
+
+        assert coordinator.get_reported_state("other") is None
+        assert coordinator.update_interval == SCAN_INTERVAL
+
+
+class TestStoreTokens:
+    """Test cases for persisting tokens to the config entry."""
+
+    @pytest.mark.asyncio
+    async def test_unchanged_tokens_not_written(self):
+        """Test the entry is only updated when the tokens changed."""
+        hass = MagicMock()
+        entry = MagicMock()
+        entry.data = {"username": "test@example.com", "tokens": {"access_token": "a"}}
+
+        await async_store_tokens(hass, entry, {"access_token": "a"})
+        hass.config_entries.async_update_entry.assert_not_called()
+
+        await async_store_tokens(hass, entry, {"access_token": "b"})
+        hass.config_entries.async_update_entry.assert_called_once_with(
+            entry,
+            data={"username": "test@example.com", "tokens": {"access_token": "b"}},
+        )
+
+
+class TestAdaptiveInterval:
+    """Test cases for polling faster while water is running."""
+
+    @pytest.mark.asyncio
+    async def test_interval_follows_running_state(self, stub_api, stub_coordinator):
+        """Test polling speeds up while running and slows down after."""
+        coordinator = stub_coordinator
+
+        await coordinator._async_update_data()
+        assert coordinator.update_interval == SCAN_INTERVAL
+
+        stub_api.get_device_shadows.return_value = {DEVICE_ID: _shadow("running")}
+        await coordinator._async_update_data()
+        assert coordinator.update_interval == ACTIVE_SCAN_INTERVAL
+
+        stub_api.get_device_shadows.return_value = {DEVICE_ID: _shadow("idle")}
+        await coordinator._async_update_data()
+        assert coordinator.update_interval == SCAN_INTERVAL
+
+
+class TestDeviceIndex:
+    """Test cases for indexing the device list."""
+
+    @pytest.mark.asyncio
+    async def test_reindexes_only_new_device_list(self, stub_api, stub_coordinator):
+        """Test the device index is rebuilt only for a new list object."""
+        coordinator = stub_coordinator
+
+        await coordinator._async_update_data()
+        devices = coordinator.get_all_devices()
+
+        await coordinator._async_update_data()
+        assert coordinator.get_all_devices() is devices
+
+        stub_api.get_cached_devices.return_value = [
+            {"clientId": DEVICE_ID},
+            {"clientId": "other"},
+        ]
+        await coordinator._async_update_data()
+        assert coordinator.get_all_devices() is not devices
+        assert set(coordinator.get_all_devices()) == {DEVICE_ID, "other"}
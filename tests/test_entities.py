@@ -0,0 +1,88 @@
+"""Tests for Moen Smart Water entities."""
+
+from __future__ import annotations
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from custom_components.moen_smart_water.button import BUTTON_DESCRIPTIONS, MoenButton
+from custom_components.moen_smart_water.number import NUMBER_DESCRIPTIONS, MoenNumber
+from custom_components.moen_smart_water.select import (
+    TEMPERATURE_PRESET_SELECT,
+    MoenSelect,
+)
+from custom_components.moen_smart_water.sensor import SENSOR_DESCRIPTIONS, MoenSensor
+
+
+def _coordinator(state: dict | None) -> MagicMock:
+    """Return a coordinator stand-in reporting the given device state."""
+    coordinator = MagicMock()
+    coordinator.last_update_success = True
+    coordinator.get_reported_state.return_value = state
+    return coordinator
+
+
+@pytest.mark.parametrize(
+    ("entity_cls", "description"),
+    [
+        (MoenSensor, SENSOR_DESCRIPTIONS[0]),
+        (MoenNumber, NUMBER_DESCRIPTIONS[0]),
+        (MoenSelect, TEMPERATURE_PRESET_SELECT),
+        (MoenButton, BUTTON_DESCRIPTIONS[0]),
+    ],
+)
+def test_state_written_only_on_change(entity_cls, description):
+    """Test unchanged coordinator updates skip the state write."""
+    coordinator = _coordinator({"temperature": 30.0, "flowRate": 50})
+    entity = entity_cls(coordinator, "device", "Faucet", description)
+    entity.async_write_ha_state = MagicMock()
+
+    entity._handle_coordinator_update()
+    entity._handle_coordinator_update()
+    assert entity.async_write_ha_state.call_count == 1
+
+    # Availability changing on its own still writes
+    coordinator.last_update_success = False
+    entity._handle_coordinator_update()
+    assert entity.async_write_ha_state.call_count == 2
+
+
+def _baseline_preset(temperature: float) -> str:
+    """Return the preset the original if/elif chain picked."""
+    if temperature <= 10:
+        return "coldest"
+    if temperature <= 25:
+        return "cold"
+    if temperature <= 40:
+        return "warm"
+    if temperature <= 60:
+        return "hot"
+    return "hottest"
+
+
+@pytest.mark.parametrize(
+    ("temperature", "expected"),
+    [
+        (-5, "coldest"),
+        (9.9, "coldest"),
+        (10, "coldest"),
+        (10.5, "cold"),
+        (25, "cold"),
+        (25.1, "warm"),
+        (40, "warm"),
+        (40.1, "hot"),
+        (60, "hot"),
+        (60.1, "hottest"),
+        (100, "hottest"),
+    ],
+)
+def test_temperature_preset_boundaries(temperature, expected):
+    """Test preset thresholds are inclusive upper bounds."""
+    coordinator = _coordinator({"temperature": temperature})
+    entity = MoenSelect(coordinator, "device", "Faucet", TEMPERATURE_PRESET_SELECT)
+    entity.async_write_ha_state = MagicMock()
+
+    entity._handle_coordinator_update()
+
+    assert entity.current_option == expected == _baseline_preset(temperature)
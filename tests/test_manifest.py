@@ -105,8 +105,8 @@ class TestManifest:
 
         assert "requirements" in manifest
         assert isinstance(manifest["requirements"], list)
-        assert len(manifest["requirements"]) > 0
-        assert "requests" in manifest["requirements"][0]
+        # The API client uses Home Assistant's bundled aiohttp
+        assert not any(req.startswith("requests") for req in manifest["requirements"])
 
 
 class TestHACSManifest: